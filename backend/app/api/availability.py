@@ -0,0 +1,488 @@
+from flask import request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.api import api_bp
+from app.models import User, Availability, Session
+from app import db
+from app.utils.response_utils import create_success_response, create_error_response, create_not_found_response, create_forbidden_response, create_validation_error_response, create_conflict_response
+from app.schemas.availability_schemas import TutorAvailabilityResponse, AvailabilityCreateRequest, AvailabilityUpdateRequest, AvailabilityListResponse
+from app.services.availability_service import AvailabilityService
+from timezone_utils import get_user_timezone_from_request, validate_time_range
+import re
+import uuid
+from datetime import datetime, date
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = None
+def _load_json():
+    """Decode the request body directly; orjson skips Flask's buffered second pass"""
+    if orjson is None:
+        return request.get_json(silent=True)
+    body = request.get_data(cache=False)
+    if not body:
+        return None
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+def _json_response(payload, status_code=200):
+    """Dump straight to bytes; orjson renders date/datetime values as ISO 8601 itself"""
+    if orjson is None:
+        return (jsonify(payload), status_code)
+    return (current_app.response_class(orjson.dumps(payload), mimetype='application/json'), status_code)
+def _parse_specific_date(s):
+    """Parse an ISO date string; plain YYYY-MM-DD skips the tz swap and datetime build"""
+    if len(s) == 10 and s[4] == '-' and s[7] == '-':
+        return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+    if _parse_iso is not None:
+        return (_parse_iso(s)).date()
+    return (datetime.fromisoformat(s.replace('Z', '+00:00'))).date()
+DAY_NAMES = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+DAY_INDEX = {name: index for index, name in enumerate(DAY_NAMES)}
+def _authorize_tutor_access(current_user_id, tutor_id):
+    """Resolve both identities with one narrow SELECT instead of two full loads
+
+    Returns an error response tuple, or None when access is allowed.
+    """
+    rows = {row.id: row for row in db.session.query(User.id, User.account_type, User.roles).filter(User.id.in_({current_user_id, tutor_id}))}
+    current_user = rows.get(current_user_id)
+    if not current_user:
+        return (jsonify({'error': 'User not found'}), 404)
+    if current_user.account_type not in ('admin',) and current_user_id != tutor_id:
+        return (jsonify({'error': 'Access denied'}), 403)
+    tutor = rows.get(tutor_id)
+    if not tutor or 'tutor' not in (tutor.roles or []):
+        return (jsonify({'error': 'User does not have tutor role'}), 404)
+    return None
+@api_bp.route('/tutors/<string:tutor_id>/availability', methods=['GET'])
+@jwt_required()
+def get_tutor_availability(tutor_id):
+    """Get tutor's availability schedule"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return create_not_found_response('User')
+        if not current_user.has_role('admin') and current_user_id != tutor_id:
+            return create_forbidden_response()
+        tutor = User.query.get(tutor_id)
+        if not tutor or not tutor.has_role('tutor'):
+            return create_not_found_response('Tutor')
+        start_date_str = request.args.get('startDate')
+        end_date_str = request.args.get('endDate')
+        query = Availability.query.filter_by(tutor_id=tutor_id)
+        if start_date_str or end_date_str:
+            try:
+                if start_date_str:
+                    start_date = (datetime.strptime(start_date_str, '%Y-%m-%d')).date()
+                    query = query.filter((Availability.specific_date >= start_date) | Availability.specific_date.is_(None))
+                if end_date_str:
+                    end_date = (datetime.strptime(end_date_str, '%Y-%m-%d')).date()
+                    query = query.filter((Availability.specific_date <= end_date) | Availability.specific_date.is_(None))
+            except ValueError as date_error:
+                return create_validation_error_response([{'field': 'date', 'message': f'Invalid date format. Use YYYY-MM-DD. {str(date_error)}'}])
+        availability_records = query.all()
+        weekly_availability = {'monday': {'available': False, 'timeSlots': []}, 'tuesday': {'available': False, 'timeSlots': []}, 'wednesday': {'available': False, 'timeSlots': []}, 'thursday': {'available': False, 'timeSlots': []}, 'friday': {'available': False, 'timeSlots': []}, 'saturday': {'available': False, 'timeSlots': []}, 'sunday': {'available': False, 'timeSlots': []}}
+        for record in availability_records:
+            day_name = DAY_NAMES[record.day_of_week]
+            if record.available:
+                weekly_availability[day_name]['available'] = True
+                weekly_availability[day_name]['timeSlots'].append({'id': record.id, 'time': f'{record.start_time}-{record.end_time}', 'startTime': record.start_time, 'endTime': record.end_time, 'course': record.course_id, 'timeZone': record.time_zone, 'specificDate': record.specific_date.isoformat() if record.specific_date else None})
+        return _json_response({'success': True, 'message': 'Tutor availability retrieved successfully', 'timestamp': (datetime.utcnow()).isoformat(), 'version': 'v1', 'data': {'availability': weekly_availability, 'tutor_id': tutor_id}})
+    except Exception as e:
+        return create_error_response(message='Failed to retrieve tutor availability', error_code='FETCH_ERROR', details={'exception': str(e)}, status_code=500)
+@api_bp.route('/tutors/<string:tutor_id>/availability', methods=['POST', 'PUT'])
+@jwt_required()
+def save_tutor_availability(tutor_id):
+    """Save or update tutor's availability schedule"""
+    try:
+        current_user_id = get_jwt_identity()
+        auth_error = _authorize_tutor_access(current_user_id, tutor_id)
+        if auth_error:
+            return auth_error
+        data = _load_json()
+        if not data or 'availability' not in data:
+            return (jsonify({'error': 'Availability data is required'}), 400)
+        availability_data = data['availability']
+        for day_name in DAY_NAMES:
+            if day_name not in availability_data:
+                return (jsonify({'error': f'Missing availability data for {day_name}'}), 400)
+        user_timezone = get_user_timezone_from_request(request)
+        browser_locale = request.headers.get('X-Browser-Locale', 'en-US')
+        try:
+            existing = {(record.day_of_week, record.start_time, record.end_time, record.specific_date): record for record in Availability.query.filter_by(tutor_id=tutor_id).all()}
+            seen_keys = set()
+            created_records = []
+            for day_index, day_name in enumerate(DAY_NAMES):
+                day_data = availability_data[day_name]
+                if day_data.get('available', False):
+                    if day_data.get('timeSlots'):
+                        for time_slot in day_data['timeSlots']:
+                            if 'time' in time_slot:
+                                start_time, end_time = time_slot['time'].split('-')
+                            else:
+                                if 'startTime' in time_slot and 'endTime' in time_slot:
+                                    start_time = time_slot['startTime']
+                                    end_time = time_slot['endTime']
+                                else:
+                                    continue
+                            if not _validate_time_format(start_time) or not _validate_time_format(end_time):
+                                return (jsonify({'error': f'Invalid time format for {day_name}. Use HH:MM format'}), 400)
+                            if start_time >= end_time:
+                                return (jsonify({'error': f'Start time must be before end time for {day_name}'}), 400)
+                            key = (day_index, start_time, end_time, None)
+                            seen_keys.add(key)
+                            if key in existing:
+                                record = existing[key]
+                                record.available = True
+                                record.time_zone = time_slot.get('timeZone', user_timezone)
+                                record.course_id = time_slot.get('course') if time_slot.get('course') else None
+                                continue
+                            availability_record = Availability(id=f'availability_{(uuid.uuid4()).hex[:8]}', tutor_id=tutor_id, day_of_week=day_index, start_time=start_time, end_time=end_time, available=True, time_zone=time_slot.get('timeZone', user_timezone), created_timezone=user_timezone, browser_timezone=user_timezone, course_id=time_slot.get('course') if time_slot.get('course') else None)
+                            db.session.add(availability_record)
+                            created_records.append(availability_record)
+            removed_ids = [record.id for key, record in existing.items() if key not in seen_keys]
+            if removed_ids:
+                Availability.query.filter(Availability.id.in_(removed_ids)).delete(synchronize_session=False)
+            db.session.commit()
+            AvailabilityService.invalidate_cache(tutor_id=tutor_id)
+            return create_success_response(data={'records_created': len(created_records), 'tutor_id': tutor_id}, message='Availability saved successfully')
+        except Exception as e:
+            db.session.rollback()
+            raise e
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/tutors/<string:tutor_id>/availability/day/<string:day>', methods=['POST'])
+@jwt_required()
+def update_day_availability(tutor_id, day):
+    """Update availability for a specific day"""
+    try:
+        current_user_id = get_jwt_identity()
+        auth_error = _authorize_tutor_access(current_user_id, tutor_id)
+        if auth_error:
+            return auth_error
+        day_index = DAY_INDEX.get(day)
+        if day_index is None:
+            return (jsonify({'error': 'Invalid day name'}), 400)
+        data = _load_json()
+        if not data:
+            return (jsonify({'error': 'Request data is required'}), 400)
+        user_timezone = get_user_timezone_from_request(request)
+        browser_locale = request.headers.get('X-Browser-Locale', 'en-US')
+        (Availability.query.filter_by(tutor_id=tutor_id, day_of_week=day_index)).delete()
+        created_records = []
+        if data.get('available', False) and data.get('timeSlots'):
+            for time_slot in data['timeSlots']:
+                if 'time' in time_slot:
+                    start_time, end_time = time_slot['time'].split('-')
+                else:
+                    if 'startTime' in time_slot and 'endTime' in time_slot:
+                        start_time = time_slot['startTime']
+                        end_time = time_slot['endTime']
+                    else:
+                        continue
+                if _validate_time_format(start_time):
+                    if _validate_time_format(end_time):
+                        if start_time < end_time:
+                            availability_record = Availability(id=f'availability_{(uuid.uuid4()).hex[:8]}', tutor_id=tutor_id, day_of_week=day_index, start_time=start_time, end_time=end_time, available=True, time_zone=time_slot.get('timeZone', user_timezone), created_timezone=user_timezone, browser_timezone=user_timezone, course_id=time_slot.get('course') if time_slot.get('course') else None)
+                            db.session.add(availability_record)
+                            created_records.append(availability_record)
+        db.session.commit()
+        return (jsonify({'message': f'Availability updated for {day}', 'day': day, 'recordsCreated': len(created_records)}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/availability/<string:availability_id>', methods=['PUT'])
+@jwt_required()
+def update_availability(availability_id):
+    """Update a specific availability slot"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        availability = Availability.query.get(availability_id)
+        if not availability:
+            return (jsonify({'error': 'Availability slot not found'}), 404)
+        if current_user.account_type not in ('admin',) and current_user_id != availability.tutor_id:
+            return (jsonify({'error': 'Access denied'}), 403)
+        data = _load_json()
+        update_option = data.get('updateOption', 'single')
+        if 'start_time' in data or 'end_time' in data:
+            new_start = data.get('start_time', availability.start_time)
+            new_end = data.get('end_time', availability.end_time)
+            booked_dates = [row.scheduled_date for row in db.session.query(Session.scheduled_date).filter_by(availability_id=availability_id)]
+            for scheduled_date in booked_dates:
+                session_time = scheduled_date.strftime('%H:%M')
+                if session_time < new_start or session_time >= new_end:
+                    return (jsonify({'error': 'Cannot update time slot - conflicts with booked sessions', 'conflicts': len(booked_dates)}), 400)
+        updated_count = 0
+        if availability.is_recurring and update_option != 'single':
+            if update_option == 'all':
+                if availability.parent_availability_id:
+                    parent_id = availability.parent_availability_id
+                    related_slots = (Availability.query.filter_by(parent_availability_id=parent_id)).all()
+                    parent = Availability.query.get(parent_id)
+                    if parent:
+                        related_slots.append(parent)
+                else:
+                    related_slots = (Availability.query.filter_by(parent_availability_id=availability.id)).all()
+                    related_slots.append(availability)
+            else:
+                if update_option == 'future':
+                    if availability.date:
+                        related_slots = Availability.query.filter(Availability.tutor_id == availability.tutor_id, Availability.date >= availability.date)
+                        if availability.parent_availability_id:
+                            related_slots = related_slots.filter_by(parent_availability_id=availability.parent_availability_id)
+                        else:
+                            related_slots = related_slots.filter((Availability.parent_availability_id == availability.id) | (Availability.id == availability.id))
+                        related_slots = related_slots.all()
+                    else:
+                        related_slots = [availability]
+                else:
+                    related_slots = [availability]
+            patch = {}
+            if 'start_time' in data:
+                patch['start_time'] = data['start_time']
+            if 'end_time' in data:
+                patch['end_time'] = data['end_time']
+            if 'available' in data:
+                patch['available'] = data['available']
+            if 'course_id' in data:
+                patch['course_id'] = data.get('course_id')
+            if 'time_zone' in data:
+                patch['time_zone'] = data['time_zone']
+            slot_ids = [slot.id for slot in related_slots]
+            if 'start_time' in data or 'end_time' in data:
+                booked_ids = {row.availability_id for row in db.session.query(Session.availability_id).filter(Session.availability_id.in_(slot_ids))}
+                slot_ids = [slot_id for slot_id in slot_ids if slot_id not in booked_ids]
+            if slot_ids and patch:
+                db.session.execute(Availability.__table__.update().where(Availability.__table__.c.id.in_(slot_ids)).values(**patch), execution_options={'synchronize_session': False})
+                db.session.expire_all()
+            updated_count = len(slot_ids)
+        else:
+            if 'start_time' in data:
+                availability.start_time = data['start_time']
+            if 'end_time' in data:
+                availability.end_time = data['end_time']
+            if 'available' in data:
+                availability.available = data['available']
+            if 'course_id' in data:
+                availability.course_id = data.get('course_id')
+            if 'time_zone' in data:
+                availability.time_zone = data['time_zone']
+            updated_count = 1
+        db.session.commit()
+        user_timezone = get_user_timezone_from_request(request)
+        return (jsonify({'message': f'Updated {updated_count} availability slot(s)', 'updatedCount': updated_count, 'availability': availability.to_dict(user_timezone=user_timezone)}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/tutors/<string:tutor_id>/availability/<string:availability_id>', methods=['DELETE'])
+@jwt_required()
+def delete_availability(tutor_id, availability_id):
+    """Delete a specific availability slot"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        if current_user.account_type not in ('admin',) and current_user_id != tutor_id:
+            return (jsonify({'error': 'Access denied'}), 403)
+        availability = (Availability.query.filter_by(id=availability_id, tutor_id=tutor_id)).first()
+        if not availability:
+            return (jsonify({'error': 'Availability slot not found'}), 404)
+        booked_count = db.session.query(db.func.count(Session.id)).filter_by(availability_id=availability_id).scalar()
+        if booked_count:
+            return (jsonify({'error': 'Cannot delete availability with booked sessions', 'bookedSessions': booked_count}), 400)
+        db.session.delete(availability)
+        db.session.commit()
+        return (jsonify({'message': 'Availability deleted successfully', 'deletedId': availability_id}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/tutors/<string:tutor_id>/availability/bulk', methods=['DELETE'])
+@jwt_required()
+def delete_multiple_availabilities(tutor_id):
+    """Delete multiple availability slots"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        if current_user.account_type not in ('admin',) and current_user_id != tutor_id:
+            return (jsonify({'error': 'Access denied'}), 403)
+        data = _load_json()
+        availability_ids = data.get('availability_ids', [])
+        delete_option = data.get('deleteOption', 'single')
+        if not availability_ids:
+            return (jsonify({'error': 'No availability IDs provided'}), 400)
+        deletable_ids = []
+        failed_deletions = []
+        for availability_id in availability_ids:
+            try:
+                availability = (Availability.query.filter_by(id=availability_id, tutor_id=tutor_id)).first()
+                if not availability:
+                    failed_deletions.append({'id': availability_id, 'reason': 'Not found'})
+                    continue
+                booked_sessions = (Session.query.filter_by(availability_id=availability_id)).all()
+                if booked_sessions:
+                    failed_deletions.append({'id': availability_id, 'reason': f'{len(booked_sessions)} booked sessions'})
+                    continue
+                if delete_option == 'series' and availability.is_recurring:
+                    if availability.parent_availability_id:
+                        related_slots = (Availability.query.filter_by(parent_availability_id=availability.parent_availability_id, tutor_id=tutor_id)).all()
+                    else:
+                        related_slots = (Availability.query.filter_by(parent_availability_id=availability.id, tutor_id=tutor_id)).all()
+                        related_slots.append(availability)
+                    for slot in related_slots:
+                        if not (Session.query.filter_by(availability_id=slot.id)).first():
+                            deletable_ids.append(slot.id)
+                else:
+                    deletable_ids.append(availability_id)
+            except Exception as e:
+                failed_deletions.append({'id': availability_id, 'reason': str(e)})
+                continue
+        deletable_ids = list(dict.fromkeys(deletable_ids))
+        for i in range(0, len(deletable_ids), 500):
+            db.session.execute(Availability.__table__.delete().where(Availability.__table__.c.id.in_(deletable_ids[i:i + 500])), execution_options={'synchronize_session': False})
+        deleted_count = len(deletable_ids)
+        db.session.commit()
+        return (jsonify({'message': f'Deleted {deleted_count} availability slots', 'deletedCount': deleted_count, 'failedDeletions': failed_deletions}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/availability/<string:availability_id>/conflicts', methods=['GET'])
+@jwt_required()
+def check_availability_conflicts(availability_id):
+    """Check for conflicts before editing or deleting an availability slot"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        availability = Availability.query.get(availability_id)
+        if not availability:
+            return (jsonify({'error': 'Availability slot not found'}), 404)
+        if current_user.account_type not in ('admin',) and current_user_id != availability.tutor_id:
+            return (jsonify({'error': 'Access denied'}), 403)
+        sessions = (Session.query.filter_by(availability_id=availability_id)).all()
+        conflicts = {'hasConflicts': len(sessions) > 0, 'bookedSessions': len(sessions), 'sessions': []}
+        for session in sessions:
+            conflicts['sessions'].append({'id': session.id, 'title': session.title, 'scheduledDate': session.scheduled_date, 'studentCount': len(session.students), 'status': session.status})
+        if availability.is_recurring:
+            conflicts['isRecurring'] = True
+            conflicts['recurringInfo'] = {'pattern': availability.recurrence_pattern, 'endDate': availability.recurrence_end_date}
+            if availability.parent_availability_id:
+                related_count = (Availability.query.filter_by(parent_availability_id=availability.parent_availability_id)).count()
+                conflicts['recurringInfo']['totalInstances'] = related_count + 1
+            else:
+                related_count = (Availability.query.filter_by(parent_availability_id=availability.id)).count()
+                conflicts['recurringInfo']['totalInstances'] = related_count + 1
+        else:
+            conflicts['isRecurring'] = False
+        return _json_response(conflicts)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/tutors/<string:tutor_id>/availability/timeslot', methods=['POST'])
+@jwt_required()
+def add_single_timeslot(tutor_id):
+    """Add a single time slot without requiring full weekly availability"""
+    try:
+        current_user_id = get_jwt_identity()
+        auth_error = _authorize_tutor_access(current_user_id, tutor_id)
+        if auth_error:
+            return auth_error
+        data = _load_json()
+        if not data:
+            return (jsonify({'error': 'Request data is required'}), 400)
+        user_timezone = get_user_timezone_from_request(request)
+        browser_locale = request.headers.get('X-Browser-Locale', 'en-US')
+        if 'timeSlot' in data:
+            time_slot = data['timeSlot']
+            time_slot.setdefault('day', data.get('day'))
+        else:
+            time_slot = {'startTime': data.get('startTime'), 'endTime': data.get('endTime'), 'specificDate': data.get('date'), 'day': data.get('day'), 'course': data.get('courseId'), 'timeZone': data.get('timeZone', user_timezone)}
+        try:
+            availability_record = _build_availability_record(time_slot, tutor_id, user_timezone)
+        except ValueError as slot_error:
+            return (jsonify({'error': str(slot_error)}), 400)
+        now = datetime.utcnow()
+        availability_record.is_recurring = False
+        availability_record.recurrence_type = 'weekly'
+        availability_record.recurrence_days = []
+        availability_record.exception_dates = []
+        availability_record.created_at = now
+        availability_record.updated_at = now
+        db.session.execute(Availability.__table__.insert().values(id=availability_record.id, tutor_id=tutor_id, day_of_week=availability_record.day_of_week, start_time=availability_record.start_time, end_time=availability_record.end_time, available=True, time_zone=availability_record.time_zone, created_timezone=user_timezone, browser_timezone=user_timezone, course_id=availability_record.course_id, specific_date=availability_record.specific_date, is_recurring=False, recurrence_type='weekly', recurrence_days=[], exception_dates=[], timezone_storage_format='local', created_at=now, updated_at=now))
+        db.session.commit()
+        return (jsonify({'message': 'Time slot added successfully', 'timeslot': availability_record.to_dict(user_timezone=user_timezone), 'tutorId': tutor_id}), 201)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+def _build_availability_record(time_slot, tutor_id, user_timezone):
+    """Build an unsaved Availability record from a single time slot payload
+
+    Raises ValueError when the slot is missing fields or fails validation.
+    """
+    for field in ('startTime', 'endTime'):
+        if not time_slot.get(field):
+            raise ValueError(f'Missing required field: {field}')
+    start_time = time_slot['startTime']
+    end_time = time_slot['endTime']
+    specific_date = None
+    if time_slot.get('specificDate'):
+        try:
+            specific_date = _parse_specific_date(time_slot['specificDate'])
+        except ValueError:
+            raise ValueError('Invalid date format for specificDate')
+        day_of_week = specific_date.weekday()
+    else:
+        day_name = time_slot.get('day')
+        day_of_week = DAY_INDEX.get(day_name) if day_name else None
+        if day_of_week is None:
+            raise ValueError('Either specificDate or day parameter is required')
+    validation_date = specific_date.isoformat() if specific_date else (datetime.now()).strftime('%Y-%m-%d')
+    time_validation = validate_time_range(start_time, end_time, validation_date, user_timezone)
+    if not time_validation['valid']:
+        raise ValueError(f"Invalid time range: {'; '.join(time_validation['errors'])}")
+    return Availability(id=f'availability_{(uuid.uuid4()).hex[:8]}', tutor_id=tutor_id, day_of_week=day_of_week, start_time=start_time, end_time=end_time, available=True, time_zone=time_slot.get('timeZone', user_timezone), created_timezone=user_timezone, browser_timezone=user_timezone, course_id=time_slot.get('course') if time_slot.get('course') else None, specific_date=specific_date)
+@api_bp.route('/tutors/<string:tutor_id>/availability/bulk', methods=['POST'])
+@jwt_required()
+def add_bulk_timeslots(tutor_id):
+    """Add multiple time slots in a single transaction"""
+    try:
+        current_user_id = get_jwt_identity()
+        auth_error = _authorize_tutor_access(current_user_id, tutor_id)
+        if auth_error:
+            return auth_error
+        data = _load_json()
+        if not data or not data.get('timeSlots'):
+            return (jsonify({'error': 'timeSlots list is required'}), 400)
+        user_timezone = get_user_timezone_from_request(request)
+        records = []
+        errors = []
+        for index, time_slot in enumerate(data['timeSlots']):
+            try:
+                records.append(_build_availability_record(time_slot, tutor_id, user_timezone))
+            except ValueError as slot_error:
+                errors.append({'index': index, 'error': str(slot_error)})
+        if errors:
+            return (jsonify({'error': 'Invalid time slots in request', 'details': errors}), 400)
+        db.session.bulk_save_objects(records, return_defaults=False)
+        db.session.commit()
+        return (jsonify({'message': f'Added {len(records)} time slots', 'createdCount': len(records), 'tutorId': tutor_id}), 201)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+_TIME_RE = re.compile('^([01]\\d|2[0-3]):[0-5]\\d$').match
+def _validate_time_format(time_str):
+    """Validate time format (HH:MM) against the precompiled matcher"""
+    return bool(_TIME_RE(time_str)) if isinstance(time_str, str) else False
+def _validate_time_format_many(time_strs):
+    """Validate an iterable of HH:MM strings in one pass"""
+    return all((isinstance(s, str) and _TIME_RE(s) for s in time_strs))
@@ -0,0 +1,260 @@
+"""
+Bulk Import API Endpoints
+Handles bulk import of tutor qualifications from CSV data
+"""
+from flask import request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from app.api import api_bp
+from app.models import User, Course, TutorQualification, BulkImportJob, CourseSettings
+from app import db
+from app.utils.auth_utils import admin_required
+from app.services.tutor_qualification_service import TutorQualificationService
+import logging
+try:
+    import orjson
+except ImportError:
+    orjson = None
+def _to_int(value, default):
+    """Coerce a JSON option to int, falling back to the default on bad input"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+def _json(payload, status_code=200):
+    """Serialize list-heavy payloads with orjson when available"""
+    if orjson is None:
+        return (jsonify(payload), status_code)
+    return (current_app.response_class(orjson.dumps(payload), mimetype='application/json'), status_code)
+_qual_service = TutorQualificationService()
+@api_bp.route('/admin/tutors/bulk-import', methods=['POST'])
+@admin_required
+def bulk_import_tutors():
+    """Bulk import tutors from CSV data (admin only)"""
+    try:
+        max_size = current_app.config.get('MAX_BULK_CSV_BYTES', 50 * 1024 * 1024)
+        if request.content_length and request.content_length > max_size:
+            return (jsonify({'error': 'Payload too large'}), 413)
+        current_user_id = get_jwt_identity()
+        data = request.get_json()
+        if not data:
+            return (jsonify({'error': 'No data provided'}), 400)
+        csv_data = data.get('csvData') or data.get('csv_data')
+        if not csv_data:
+            return (jsonify({'error': 'CSV data is required'}), 400)
+        import_settings = data.get('import_settings', {})
+        options = {'dry_run': data.get('dryRun', data.get('dry_run', False)), 'skip_existing': data.get('skipExisting', import_settings.get('skip_existing', False)), 'auto_qualify': data.get('autoQualify', import_settings.get('auto_qualify', True)), 'notification_email': data.get('notificationEmail', data.get('notification_email', '')), 'auto_add_headers': True, 'commit_size': _to_int(data.get('commitSize'), 500)}
+        result = _qual_service.process_bulk_import(csv_data, current_user_id, options)
+        return (jsonify(result), 200)
+    except Exception as e:
+        logging.error(f'Bulk import error: {str(e)}')
+        return (jsonify({'error': f'Import failed: {str(e)}'}), 500)
+@api_bp.route('/admin/tutors/bulk-import-file', methods=['POST'])
+@admin_required
+def bulk_import_tutors_file():
+    """Bulk import tutors from uploaded CSV file (admin only)"""
+    try:
+        max_size = current_app.config.get('MAX_BULK_CSV_BYTES', 50 * 1024 * 1024)
+        if request.content_length and request.content_length > max_size:
+            return (jsonify({'error': 'Payload too large'}), 413)
+        current_user_id = get_jwt_identity()
+        if 'csv_file' not in request.files:
+            return (jsonify({'error': 'No file uploaded'}), 400)
+        file = request.files['csv_file']
+        if file.filename == '':
+            return (jsonify({'error': 'No file selected'}), 400)
+        if not (file.filename.lower()).endswith('.csv'):
+            return (jsonify({'error': 'File must be a CSV file'}), 400)
+        options = {'dry_run': (request.form.get('dryRun', 'false')).lower() == 'true', 'skip_existing': (request.form.get('skipExisting', 'false')).lower() == 'true', 'auto_qualify': (request.form.get('autoQualify', 'true')).lower() == 'true', 'notification_email': request.form.get('notificationEmail', ''), 'auto_add_headers': True, 'commit_size': request.form.get('commitSize', 500, type=int)}
+        result = _qual_service.process_bulk_import_file(file, current_user_id, options)
+        return (jsonify(result), 200)
+    except Exception as e:
+        logging.error(f'Bulk import file error: {str(e)}')
+        return (jsonify({'error': f'Import failed: {str(e)}'}), 500)
+@api_bp.route('/admin/tutors/qualify', methods=['POST'])
+@admin_required
+def manually_qualify_tutor():
+    """Manually qualify a tutor for a course (admin only)"""
+    try:
+        current_user_id = get_jwt_identity()
+        data = request.get_json()
+        email = data.get('email') or data.get('user_email')
+        course_id = data.get('courseId') or data.get('course_id')
+        reason = data.get('reason') or data.get('notes', '')
+        if not data or not email or not course_id:
+            return (jsonify({'error': 'Email and course ID are required'}), 400)
+        result = _qual_service.manually_qualify_tutor(email=email, course_id=course_id, admin_user_id=current_user_id, reason=reason)
+        return (jsonify(result), 200 if result['success'] else 400)
+    except Exception as e:
+        logging.error(f'Manual qualification error: {str(e)}')
+        return (jsonify({'error': f'Qualification failed: {str(e)}'}), 500)
+@api_bp.route('/admin/tutors/qualifications', methods=['GET'])
+@admin_required
+def get_tutor_qualifications():
+    """Get all tutor qualifications with filtering (admin only)"""
+    try:
+        current_user_id = get_jwt_identity()
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        course_id = request.args.get('course_id')
+        user_id = request.args.get('user_id')
+        status = request.args.get('status', 'active')
+        filters = []
+        if course_id:
+            filters.append(TutorQualification.course_id == course_id)
+        if user_id:
+            filters.append(TutorQualification.user_id == user_id)
+        if status == 'active':
+            filters.append(TutorQualification.is_active == True)
+        elif status == 'inactive':
+            filters.append(TutorQualification.is_active == False)
+        base_query = db.session.query(TutorQualification.id, TutorQualification.user_id, TutorQualification.course_id, TutorQualification.qualification_type, TutorQualification.qualifying_score, TutorQualification.is_active, TutorQualification.approved_by, TutorQualification.revoked_by, TutorQualification.revoked_at, TutorQualification.revoke_reason, TutorQualification.qualified_at, TutorQualification.created_at, TutorQualification.updated_at, User.email, User.profile, Course.title).join(User, TutorQualification.user_id == User.id).join(Course, TutorQualification.course_id == Course.id).filter(*filters)
+        cursor = request.args.get('cursor')
+        if cursor:
+            items = base_query.filter(TutorQualification.id > cursor).order_by(TutorQualification.id).limit(per_page + 1).all()
+            has_next = len(items) > per_page
+            items = items[:per_page]
+        else:
+            total = db.session.query(db.func.count(TutorQualification.id)).filter(*filters).scalar()
+            items = base_query.limit(per_page).offset((page - 1) * per_page).all()
+            pages = (total + per_page - 1) // per_page if per_page > 0 else 0
+        result_data = []
+        for row in items:
+            profile = row.profile or {}
+            result_data.append({'id': row.id, 'userId': row.user_id, 'courseId': row.course_id, 'qualificationType': row.qualification_type, 'qualifyingScore': row.qualifying_score, 'isActive': row.is_active, 'approvedBy': row.approved_by, 'revokedBy': row.revoked_by, 'revokedAt': row.revoked_at.isoformat() if row.revoked_at else None, 'revokeReason': row.revoke_reason, 'qualifiedAt': row.qualified_at.isoformat() if row.qualified_at else None, 'createdAt': row.created_at.isoformat() if row.created_at else None, 'updatedAt': row.updated_at.isoformat() if row.updated_at else None, 'user': {'id': row.user_id, 'email': row.email, 'name': f"{profile.get('firstName', '')} {profile.get('lastName', '')}".strip() or row.email}, 'course': {'id': row.course_id, 'title': row.title}})
+        if cursor:
+            return _json({'qualifications': result_data, 'hasNext': has_next, 'nextCursor': items[-1].id if has_next and items else None})
+        return _json({'qualifications': result_data, 'total': total, 'pages': pages, 'currentPage': page, 'hasNext': page < pages, 'hasPrev': page > 1})
+    except Exception as e:
+        logging.error(f'Get qualifications error: {str(e)}')
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/admin/tutors/qualifications/<string:qualification_id>', methods=['DELETE'])
+@admin_required
+def revoke_tutor_qualification(qualification_id):
+    """Revoke a tutor qualification (admin only)"""
+    try:
+        current_user_id = get_jwt_identity()
+        data = request.get_json() or {}
+        reason = data.get('reason', '')
+        result = _qual_service.revoke_qualification(qualification_id, current_user_id, reason)
+        return (jsonify(result), 200 if result['success'] else 400)
+    except Exception as e:
+        logging.error(f'Revoke qualification error: {str(e)}')
+        return (jsonify({'error': f'Revocation failed: {str(e)}'}), 500)
+@api_bp.route('/admin/courses/settings', methods=['GET'])
+@admin_required
+def get_all_course_settings():
+    """Get qualification settings for all courses (admin only)"""
+    try:
+        current_user_id = get_jwt_identity()
+        courses = Course.query.all()
+        existing = {course_settings.course_id: course_settings for course_settings in CourseSettings.query.filter(CourseSettings.course_id.in_([course.id for course in courses]))} if courses else {}
+        missing = [course.id for course in courses if course.id not in existing]
+        if missing:
+            for course_id in missing:
+                course_settings = CourseSettings(course_id=course_id, created_by=current_user_id, updated_by=current_user_id)
+                db.session.add(course_settings)
+                existing[course_id] = course_settings
+            try:
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                existing = {course_settings.course_id: course_settings for course_settings in CourseSettings.query.filter(CourseSettings.course_id.in_([course.id for course in courses]))}
+        settings = []
+        for course in courses:
+            setting_dict = existing[course.id].to_dict()
+            setting_dict['course'] = {'id': course.id, 'title': course.title}
+            settings.append(setting_dict)
+        return _json({'settings': settings, 'total': len(settings)})
+    except Exception as e:
+        logging.error(f'Get course settings error: {str(e)}')
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/admin/courses/<string:course_id>/settings', methods=['GET', 'PUT'])
+@admin_required
+def manage_course_settings(course_id):
+    """Get or update settings for a specific course (admin only)"""
+    try:
+        current_user_id = get_jwt_identity()
+        course = Course.query.get(course_id)
+        if not course:
+            return (jsonify({'error': 'Course not found'}), 404)
+        if request.method == 'GET':
+            settings = CourseSettings.get_or_create_for_course(course_id, current_user_id)
+            setting_dict = settings.to_dict()
+            setting_dict['course'] = {'id': course.id, 'title': course.title}
+            return (jsonify(setting_dict), 200)
+        if request.method == 'PUT':
+            data = request.get_json()
+            if not data:
+                return (jsonify({'error': 'No data provided'}), 400)
+            settings = CourseSettings.get_or_create_for_course(course_id, current_user_id)
+            if 'minScoreToTutor' in data:
+                settings.min_score_to_tutor = float(data['minScoreToTutor'])
+            if 'auto_qualify' in data:
+                settings.auto_qualify = bool(data['auto_qualify'])
+            if 'autoApproveTutors' in data:
+                settings.auto_approve_tutors = bool(data['autoApproveTutors'])
+            if 'manualApprovalRequired' in data:
+                settings.manual_approval_required = bool(data['manualApprovalRequired'])
+            if 'allowStudentTutors' in data:
+                settings.allow_student_tutors = bool(data['allowStudentTutors'])
+            if 'maxAttemptsBeforeTutorEligible' in data:
+                settings.max_attempts_before_tutor_eligible = int(data['maxAttemptsBeforeTutorEligible'])
+            settings.updated_by = current_user_id
+            db.session.commit()
+            return (jsonify({'success': True, 'settings': settings.to_dict()}), 200)
+        return
+    except Exception as e:
+        db.session.rollback()
+        logging.error(f'Course settings error: {str(e)}')
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/admin/bulk-import-jobs', methods=['GET'])
+@admin_required
+def get_bulk_import_jobs():
+    """Get bulk import job history (admin only)"""
+    try:
+        current_user_id = get_jwt_identity()
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        status = request.args.get('status')
+        filters = []
+        if status:
+            filters.append(BulkImportJob.job_status == status)
+        base_query = db.session.query(BulkImportJob.id, BulkImportJob.job_status, BulkImportJob.file_name, BulkImportJob.import_type, BulkImportJob.total_records, BulkImportJob.successful_records, BulkImportJob.failed_records, BulkImportJob.skipped_records, BulkImportJob.errors, BulkImportJob.results, BulkImportJob.options, BulkImportJob.imported_by, BulkImportJob.created_at, BulkImportJob.started_at, BulkImportJob.completed_at, User.email).join(User, BulkImportJob.imported_by == User.id).filter(*filters)
+        cursor = request.args.get('cursor')
+        if cursor:
+            cursor_created = (db.session.query(BulkImportJob.created_at).filter_by(id=cursor)).scalar()
+            if cursor_created is not None:
+                base_query = base_query.filter(or_(BulkImportJob.created_at < cursor_created, and_(BulkImportJob.created_at == cursor_created, BulkImportJob.id < cursor)))
+            items = base_query.order_by(BulkImportJob.created_at.desc(), BulkImportJob.id.desc()).limit(per_page + 1).all()
+            has_next = len(items) > per_page
+            items = items[:per_page]
+        else:
+            total = db.session.query(db.func.count(BulkImportJob.id)).filter(*filters).scalar()
+            items = base_query.order_by(BulkImportJob.created_at.desc()).limit(per_page).offset((page - 1) * per_page).all()
+            pages = (total + per_page - 1) // per_page if per_page > 0 else 0
+        result_data = []
+        for row in items:
+            result_data.append({'id': row.id, 'jobStatus': row.job_status, 'fileName': row.file_name, 'importType': row.import_type, 'totalRecords': row.total_records, 'successfulRecords': row.successful_records, 'failedRecords': row.failed_records, 'skippedRecords': row.skipped_records, 'errors': row.errors, 'results': row.results, 'options': row.options, 'importedBy': {'id': row.imported_by, 'email': row.email}, 'createdAt': row.created_at.isoformat() if row.created_at else None, 'startedAt': row.started_at.isoformat() if row.started_at else None, 'completedAt': row.completed_at.isoformat() if row.completed_at else None})
+        if cursor:
+            return _json({'jobs': result_data, 'hasNext': has_next, 'nextCursor': items[-1].id if has_next and items else None})
+        return _json({'jobs': result_data, 'total': total, 'pages': pages, 'currentPage': page, 'hasNext': page < pages, 'hasPrev': page > 1})
+    except Exception as e:
+        logging.error(f'Get import jobs error: {str(e)}')
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/admin/bulk-import-jobs/<string:job_id>', methods=['GET'])
+@admin_required
+def get_bulk_import_job_details(job_id):
+    """Get detailed information about a specific import job (admin only)"""
+    try:
+        current_user_id = get_jwt_identity()
+        job = BulkImportJob.query.get(job_id)
+        if not job:
+            return (jsonify({'error': 'Import job not found'}), 404)
+        job_dict = job.to_dict()
+        job_dict['importedBy'] = {'id': job.imported_by_user.id, 'email': job.imported_by_user.email}
+        return (jsonify(job_dict), 200)
+    except Exception as e:
+        logging.error(f'Get import job details error: {str(e)}')
+        return (jsonify({'error': str(e)}), 500)
@@ -0,0 +1,372 @@
+from flask import Blueprint, request, jsonify, current_app, g
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app import db
+from app.models import User, Course, Enrollment, CourseChat, ChatParticipant, ChatMessage, MessageReadStatus, SystemSettings, course_tutors
+from sqlalchemy import and_, func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from app.services.cache_manager import cache_manager
+from datetime import datetime
+import hashlib
+import os
+import time
+try:
+    import orjson
+except ImportError:
+    orjson = None
+chat_bp = Blueprint('chat', __name__)
+def _json(payload, status_code=200):
+    """Serialize payload with orjson when available, falling back to jsonify"""
+    if orjson is not None:
+        return current_app.response_class(orjson.dumps(payload), status=status_code, mimetype='application/json')
+    return (jsonify(payload), status_code)
+def _etag_for(seed):
+    """Derive a stable ETag from a response-identity string"""
+    return (hashlib.sha1(seed.encode())).hexdigest()
+def _with_etag(rv, etag):
+    """Attach an ETag to a response or (response, status) pair"""
+    resp = rv[0] if isinstance(rv, tuple) else rv
+    resp.set_etag(etag)
+    return rv
+def _serialize_message(msg, sender=None):
+    """Flat ChatMessage serializer; sender is a (id, email, profile) row or None"""
+    return {'id': msg.id, 'chatId': msg.chat_id, 'senderId': msg.sender_id, 'messageText': msg.message_text, 'messageType': msg.message_type, 'createdAt': msg.created_at.isoformat() if msg.created_at else None, 'editedAt': msg.edited_at.isoformat() if msg.edited_at else None, 'isDeleted': msg.is_deleted, 'replyToMessageId': msg.reply_to_message_id, 'fileName': msg.file_name, 'filePath': msg.file_path, 'fileSize': msg.file_size, 'fileType': msg.file_type, 'senderName': (sender.profile or {}).get('name', sender.email) if sender else None, 'senderEmail': sender.email if sender else None}
+def _serialize_messages(items):
+    """Serialize messages with one batched sender lookup instead of per-row lazy loads"""
+    sender_ids = {msg.sender_id for msg in items}
+    senders = {}
+    if sender_ids:
+        senders = {row.id: row for row in (db.session.query(User.id, User.email, User.profile).filter(User.id.in_(sender_ids))).all()}
+    return [_serialize_message(msg, senders.get(msg.sender_id)) for msg in items]
+_CHAT_ENABLED_CACHE_KEY = 'chat:system_enabled'
+_CHAT_ENABLED_CACHE_TTL = 60
+_CHAT_ENABLED_LOCAL_WINDOW = 5.0
+_CHAT_PERMISSION_CACHE_TTL = 300
+_COURSE_TUTORS_CACHE_TTL = 600
+_chat_enabled_local = {'value': None, 'checked_at': 0.0}
+def is_chat_enabled():
+    """Check if chat system is enabled by admin (process-local flag over the shared cache)"""
+    now = time.monotonic()
+    if _chat_enabled_local['value'] is not None and now - _chat_enabled_local['checked_at'] < _CHAT_ENABLED_LOCAL_WINDOW:
+        return _chat_enabled_local['value']
+    enabled = cache_manager.get(_CHAT_ENABLED_CACHE_KEY)
+    if enabled is None:
+        enabled = bool(SystemSettings.get_setting('chat_system_enabled', False))
+        cache_manager.set(_CHAT_ENABLED_CACHE_KEY, enabled, ttl=_CHAT_ENABLED_CACHE_TTL)
+    _chat_enabled_local['value'] = enabled
+    _chat_enabled_local['checked_at'] = now
+    return enabled
+def _request_user():
+    """Memoize the JWT user on flask.g so one request loads it at most once"""
+    if 'chat_user' not in g:
+        g.chat_user = User.query.get(get_jwt_identity())
+    return g.chat_user
+def get_user_role_cached(user_id):
+    """Resolve user_id -> account_type through the cache to skip the User lookup"""
+    cache_key = f'user:role:{user_id}'
+    role = cache_manager.get(cache_key)
+    if role is not None:
+        return role
+    user = _request_user()
+    if not user:
+        return None
+    cache_manager.set(cache_key, user.account_type, ttl=_CHAT_PERMISSION_CACHE_TTL)
+    return user.account_type
+def get_course_tutor_ids_cached(course_id):
+    """Resolve course_id -> tutor id list through the cache; invalidated on (un)assignment"""
+    cache_key = f'course:tutors:{course_id}'
+    tutor_ids = cache_manager.get(cache_key)
+    if tutor_ids is not None:
+        return tutor_ids
+    tutor_ids = [row.tutor_id for row in (db.session.query(course_tutors.c.tutor_id).filter(course_tutors.c.course_id == course_id)).all()]
+    cache_manager.set(cache_key, tutor_ids, ttl=_COURSE_TUTORS_CACHE_TTL)
+    return tutor_ids
+def is_course_member_cached(user_id, course_id, account_type):
+    """Resolve course membership ('enrolled', 'tutor', 'no' or 'missing') through the cache"""
+    cache_key = f'course:member:{course_id}:{user_id}'
+    membership = cache_manager.get(cache_key)
+    if membership is not None:
+        return membership
+    course_exists = (db.session.query(Course.id).filter_by(id=course_id)).first()
+    if not course_exists:
+        return 'missing'
+    if account_type == 'student':
+        enrollment = (Enrollment.query.filter_by(student_id=user_id, course_id=course_id, status='active')).first()
+        membership = 'enrolled' if enrollment else 'no'
+    elif account_type == 'tutor':
+        membership = 'tutor' if user_id in get_course_tutor_ids_cached(course_id) else 'no'
+    else:
+        membership = 'no'
+    cache_manager.set(cache_key, membership, ttl=_CHAT_PERMISSION_CACHE_TTL)
+    return membership
+def check_chat_permission(user_id, course_id, action='view'):
+    """Check if user has permission to perform chat actions on a course"""
+    account_type = get_user_role_cached(user_id)
+    if account_type is None:
+        return (False, 'User not found')
+    if account_type == 'admin':
+        return (True, None)
+    membership = is_course_member_cached(user_id, course_id, account_type)
+    if membership == 'missing':
+        return (False, 'Course not found')
+    if account_type == 'student':
+        if membership != 'enrolled':
+            return (False, 'Student not enrolled in this course')
+        return (True, None)
+    if account_type == 'tutor':
+        if membership != 'tutor':
+            return (False, 'Tutor not assigned to this course')
+        return (True, None)
+    return (False, 'Invalid user type for chat access')
+@chat_bp.route('/status', methods=['GET'])
+@jwt_required()
+def get_chat_status():
+    """Get chat system status"""
+    try:
+        enabled = is_chat_enabled()
+        etag = _etag_for(f'chat-status:{enabled}')
+        if request.if_none_match.contains(etag):
+            return ('', 304)
+        return _with_etag((jsonify({'success': True, 'enabled': enabled}), 200), etag)
+    except Exception as e:
+        return (jsonify({'success': False, 'error': str(e)}), 500)
+@chat_bp.route('/courses/<course_id>/chat', methods=['GET'])
+@jwt_required()
+def get_or_create_course_chat(course_id):
+    """Get or create chat for a specific course"""
+    try:
+        if not is_chat_enabled():
+            return (jsonify({'success': False, 'error': 'Chat system is disabled'}), 403)
+        user_id = get_jwt_identity()
+        has_permission, error_msg = check_chat_permission(user_id, course_id)
+        if not has_permission:
+            return (jsonify({'success': False, 'error': error_msg}), 403)
+        chat = (CourseChat.query.filter_by(course_id=course_id, is_active=True)).first()
+        current_role = get_user_role_cached(user_id)
+        if not chat:
+            course_title = (db.session.query(Course.title).filter_by(id=course_id)).scalar()
+            chat = CourseChat(course_id=course_id, name=f'{course_title} - Course Chat', created_by=user_id)
+            db.session.add(chat)
+            db.session.flush()
+            rows = [{'chat_id': chat.id, 'user_id': user_id, 'role': current_role}]
+            rows.extend(({'chat_id': chat.id, 'user_id': tutor_id, 'role': 'tutor'} for tutor_id in get_course_tutor_ids_cached(course_id) if tutor_id != user_id))
+            db.session.execute(ChatParticipant.__table__.insert(), rows)
+        existing_ids = {row.user_id for row in (db.session.query(ChatParticipant.user_id).filter_by(chat_id=chat.id, is_active=True)).all()}
+        new_rows = []
+        if user_id not in existing_ids:
+            new_rows.append({'chat_id': chat.id, 'user_id': user_id, 'role': current_role})
+            existing_ids.add(user_id)
+        if current_role == 'tutor':
+            for tutor_id in get_course_tutor_ids_cached(course_id):
+                if tutor_id not in existing_ids:
+                    new_rows.append({'chat_id': chat.id, 'user_id': tutor_id, 'role': 'tutor'})
+                    existing_ids.add(tutor_id)
+        if new_rows:
+            db.session.execute(ChatParticipant.__table__.insert(), new_rows)
+        db.session.commit()
+        participants = (ChatParticipant.query.filter_by(chat_id=chat.id, is_active=True)).all()
+        chat_data = chat.to_dict()
+        chat_data['participants'] = [p.to_dict() for p in participants]
+        return (jsonify({'success': True, 'chat': chat_data}), 200)
+    except Exception as e:
+        current_app.logger.error(f'Error getting/creating course chat: {str(e)}')
+        db.session.rollback()
+        return (jsonify({'success': False, 'error': str(e)}), 500)
+@chat_bp.route('/courses/<course_id>/messages', methods=['GET'])
+@jwt_required()
+def get_chat_messages(course_id):
+    """Get chat messages for a course"""
+    try:
+        if not is_chat_enabled():
+            return (jsonify({'success': False, 'error': 'Chat system is disabled'}), 403)
+        user_id = get_jwt_identity()
+        has_permission, error_msg = check_chat_permission(user_id, course_id)
+        if not has_permission:
+            return (jsonify({'success': False, 'error': error_msg}), 403)
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 50, type=int), 100)
+        before_id = request.args.get('before_id')
+        chat = (CourseChat.query.filter_by(course_id=course_id, is_active=True)).first()
+        if not chat:
+            if before_id:
+                return (jsonify({'success': True, 'messages': [], 'nextCursor': None}), 200)
+            return (jsonify({'success': True, 'messages': [], 'total': 0, 'page': page, 'pages': 0}), 200)
+        etag = _etag_for(f'chat-messages:{chat.id}:{chat.last_message_at}:{page}:{per_page}:{before_id}')
+        if request.if_none_match.contains(etag):
+            return ('', 304)
+        messages_query = ((ChatMessage.query.with_entities(ChatMessage.id, ChatMessage.chat_id, ChatMessage.sender_id, ChatMessage.message_text, ChatMessage.message_type, ChatMessage.created_at, ChatMessage.edited_at, ChatMessage.is_deleted, ChatMessage.reply_to_message_id, ChatMessage.file_name, ChatMessage.file_path, ChatMessage.file_size, ChatMessage.file_type)).filter_by(chat_id=chat.id, is_deleted=False)).order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+        if before_id:
+            before_created = (db.session.query(ChatMessage.created_at).filter_by(id=before_id)).scalar()
+            if before_created is not None:
+                messages_query = messages_query.filter(or_(ChatMessage.created_at < before_created, and_(ChatMessage.created_at == before_created, ChatMessage.id < before_id)))
+            rows = (messages_query.limit(per_page + 1)).all()
+            next_cursor = rows[per_page - 1].id if len(rows) > per_page else None
+            messages = _serialize_messages(rows[:per_page])
+            return _with_etag(_json({'success': True, 'messages': messages, 'nextCursor': next_cursor}), etag)
+        paginated = messages_query.paginate(page=page, per_page=per_page, error_out=False)
+        messages = _serialize_messages(paginated.items)
+        return _with_etag(_json({'success': True, 'messages': messages, 'total': paginated.total, 'page': page, 'pages': paginated.pages}), etag)
+    except Exception as e:
+        current_app.logger.error(f'Error getting chat messages: {str(e)}')
+        return (jsonify({'success': False, 'error': str(e)}), 500)
+@chat_bp.route('/courses/<course_id>/messages', methods=['POST'])
+@jwt_required()
+def send_message(course_id):
+    """Send a message to course chat"""
+    try:
+        if not is_chat_enabled():
+            return (jsonify({'success': False, 'error': 'Chat system is disabled'}), 403)
+        user_id = get_jwt_identity()
+        has_permission, error_msg = check_chat_permission(user_id, course_id, 'send')
+        if not has_permission:
+            return (jsonify({'success': False, 'error': error_msg}), 403)
+        data = request.get_json()
+        message_text = (data.get('message_text', '')).strip()
+        reply_to_message_id = data.get('reply_to_message_id')
+        if not message_text:
+            return (jsonify({'success': False, 'error': 'Message text is required'}), 400)
+        row = ((db.session.query(CourseChat.id, ChatParticipant.can_send_messages).join(ChatParticipant, and_(ChatParticipant.chat_id == CourseChat.id, ChatParticipant.user_id == user_id, ChatParticipant.is_active == True))).filter(CourseChat.course_id == course_id, CourseChat.is_active == True)).first()
+        if not row:
+            chat_exists = (db.session.query(CourseChat.id).filter_by(course_id=course_id, is_active=True)).first()
+            if not chat_exists:
+                return (jsonify({'success': False, 'error': 'Chat not found'}), 404)
+            return (jsonify({'success': False, 'error': 'You do not have permission to send messages'}), 403)
+        if not row.can_send_messages:
+            return (jsonify({'success': False, 'error': 'You do not have permission to send messages'}), 403)
+        chat_id = row.id
+        message = ChatMessage(chat_id=chat_id, sender_id=user_id, message_text=message_text, reply_to_message_id=reply_to_message_id)
+        db.session.add(message)
+        (CourseChat.query.filter_by(id=chat_id)).update({'last_message_at': datetime.utcnow()}, synchronize_session=False)
+        db.session.commit()
+        return (jsonify({'success': True, 'message': message.to_dict()}), 201)
+    except Exception as e:
+        current_app.logger.error(f'Error sending message: {str(e)}')
+        db.session.rollback()
+        return (jsonify({'success': False, 'error': str(e)}), 500)
+@chat_bp.route('/messages/<message_id>/read', methods=['POST'])
+@jwt_required()
+def mark_message_read(message_id):
+    """Mark a message as read"""
+    try:
+        if not is_chat_enabled():
+            return (jsonify({'success': False, 'error': 'Chat system is disabled'}), 403)
+        user_id = get_jwt_identity()
+        message = ChatMessage.query.get(message_id)
+        if not message:
+            return (jsonify({'success': False, 'error': 'Message not found'}), 404)
+        participant = (ChatParticipant.query.filter_by(chat_id=message.chat_id, user_id=user_id, is_active=True)).first()
+        if not participant:
+            return (jsonify({'success': False, 'error': 'You are not a participant in this chat'}), 403)
+        try:
+            db.session.execute((MessageReadStatus.__table__.insert()).values(message_id=message_id, user_id=user_id))
+            participant.last_read_at = datetime.utcnow()
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+        return (jsonify({'success': True}), 200)
+    except Exception as e:
+        current_app.logger.error(f'Error marking message as read: {str(e)}')
+        db.session.rollback()
+        return (jsonify({'success': False, 'error': str(e)}), 500)
+@chat_bp.route('/user/conversations', methods=['GET'])
+@jwt_required()
+def get_user_conversations():
+    """Get all conversations for current user"""
+    try:
+        if not is_chat_enabled():
+            return (jsonify({'success': False, 'error': 'Chat system is disabled'}), 403)
+        user_id = get_jwt_identity()
+        chats = (((db.session.query(CourseChat).join(ChatParticipant, ChatParticipant.chat_id == CourseChat.id)).filter(ChatParticipant.user_id == user_id, ChatParticipant.is_active == True, CourseChat.is_active == True)).order_by((CourseChat.last_message_at.desc()).nulls_last())).all()
+        chat_ids = [chat.id for chat in chats]
+        unread_counts = {}
+        if chat_ids:
+            unread_counts = dict(((db.session.query(ChatMessage.chat_id, func.count(ChatMessage.id)).outerjoin(MessageReadStatus, and_(MessageReadStatus.message_id == ChatMessage.id, MessageReadStatus.user_id == user_id))).filter(ChatMessage.chat_id.in_(chat_ids), ChatMessage.sender_id != user_id, ChatMessage.is_deleted == False, MessageReadStatus.id.is_(None)).group_by(ChatMessage.chat_id)).all())
+        conversations = []
+        for chat in chats:
+            chat_data = chat.to_dict()
+            chat_data['unreadCount'] = unread_counts.get(chat.id, 0)
+            conversations.append(chat_data)
+        return _json({'success': True, 'conversations': conversations})
+    except Exception as e:
+        current_app.logger.error(f'Error getting user conversations: {str(e)}')
+        return (jsonify({'success': False, 'error': str(e)}), 500)
+@chat_bp.route('/admin/all', methods=['GET'])
+@jwt_required()
+def get_all_chats_admin():
+    """Admin endpoint to get all chats with filtering"""
+    try:
+        if not is_chat_enabled():
+            return (jsonify({'success': False, 'error': 'Chat system is disabled'}), 403)
+        user_id = get_jwt_identity()
+        user = _request_user()
+        if user.account_type != 'admin':
+            return (jsonify({'success': False, 'error': 'Admin access required'}), 403)
+        course_id = request.args.get('course_id')
+        tutor_id = request.args.get('tutor_id')
+        student_id = request.args.get('student_id')
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
+        query = CourseChat.query.filter_by(is_active=True)
+        if course_id:
+            query = query.filter_by(course_id=course_id)
+        if tutor_id or student_id:
+            query = query.join(ChatParticipant)
+            if tutor_id:
+                query = query.filter(ChatParticipant.user_id == tutor_id, ChatParticipant.role == 'tutor')
+            if student_id:
+                query = query.filter(ChatParticipant.user_id == student_id, ChatParticipant.role == 'student')
+        query = query.options(selectinload(CourseChat.participants))
+        paginated = (query.order_by((CourseChat.last_message_at.desc()).nulls_last())).paginate(page=page, per_page=per_page, error_out=False)
+        chat_ids = [chat.id for chat in paginated.items]
+        message_counts = {}
+        if chat_ids:
+            message_counts = dict(((db.session.query(ChatMessage.chat_id, func.count(ChatMessage.id)).filter(ChatMessage.chat_id.in_(chat_ids), ChatMessage.is_deleted == False)).group_by(ChatMessage.chat_id)).all())
+        chats = []
+        for chat in paginated.items:
+            chat_data = chat.to_dict()
+            chat_data['participants'] = [p.to_dict() for p in chat.participants if p.is_active]
+            chat_data['messageCount'] = message_counts.get(chat.id, 0)
+            chats.append(chat_data)
+        return (jsonify({'success': True, 'chats': chats, 'total': paginated.total, 'page': page, 'pages': paginated.pages}), 200)
+    except Exception as e:
+        current_app.logger.error(f'Error getting admin chats: {str(e)}')
+        return (jsonify({'success': False, 'error': str(e)}), 500)
+@chat_bp.route('/admin/settings', methods=['GET'])
+@jwt_required()
+def get_chat_settings():
+    """Get chat system settings (admin only)"""
+    try:
+        user_id = get_jwt_identity()
+        user = _request_user()
+        if user.account_type != 'admin':
+            return (jsonify({'success': False, 'error': 'Admin access required'}), 403)
+        enabled = SystemSettings.get_setting('chat_system_enabled', False)
+        return (jsonify({'success': True, 'settings': {'enabled': enabled}}), 200)
+    except Exception as e:
+        current_app.logger.error(f'Error getting chat settings: {str(e)}')
+        return (jsonify({'success': False, 'error': str(e)}), 500)
+@chat_bp.route('/admin/settings', methods=['POST'])
+@jwt_required()
+def update_chat_settings():
+    """Update chat system settings (admin only)"""
+    try:
+        user_id = get_jwt_identity()
+        user = _request_user()
+        if user.account_type != 'admin':
+            return (jsonify({'success': False, 'error': 'Admin access required'}), 403)
+        data = request.get_json()
+        enabled = data.get('enabled', False)
+        SystemSettings.set_setting('chat_system_enabled', enabled, description='Enable/disable the course chat system', updated_by=user_id)
+        cache_manager.delete(_CHAT_ENABLED_CACHE_KEY)
+        _chat_enabled_local['value'] = bool(enabled)
+        _chat_enabled_local['checked_at'] = time.monotonic()
+        try:
+            from app import socketio
+            socketio.start_background_task(socketio.emit, 'chat_system_toggled', {'enabled': enabled, 'message': f"Chat system {'enabled' if enabled else 'disabled'} by administrator"})
+            current_app.logger.info(f'Socket broadcast queued: chat_system_toggled, enabled: {enabled}')
+        except Exception as socket_error:
+            current_app.logger.error(f'Failed to queue socket event: {str(socket_error)}')
+        return (jsonify({'success': True, 'message': f"Chat system {'enabled' if enabled else 'disabled'} successfully"}), 200)
+    except Exception as e:
+        current_app.logger.error(f'Error updating chat settings: {str(e)}')
+        return (jsonify({'success': False, 'error': str(e)}), 500)
@@ -0,0 +1,447 @@
+from flask import request, jsonify, g, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app.api import api_bp
+from app.models import User, Course, Module, Enrollment, Availability, Session, StudentCreditAllocation, CreditTransaction, Notification, course_tutors
+from app.services.zoom_service import zoom_service
+from app.services.availability_service import AvailabilityService
+from app.services.websocket_service import websocket_service, EventCategory
+from app.services.tutor_assignment_service import TutorAssignmentService
+from app.utils.currency import get_currency_from_country
+from app.services.cache_manager import cache_manager
+from app import db
+from sqlalchemy import update as sa_update
+from sqlalchemy.orm import joinedload, selectinload
+import logging
+from datetime import datetime
+from functools import wraps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+logger = logging.getLogger(__name__)
+def _broadcast_assignment_events(course_dict, tutor_ids, assigned_by, course_id):
+    """Fan out course-assignment events without holding up the HTTP response"""
+    timestamp = (datetime.utcnow()).isoformat()
+    for tid in tutor_ids:
+        logger.debug('Broadcasting event to tutor %s for course %s', tid, course_id)
+        websocket_service.broadcast_admin_event(event_category=EventCategory.COURSE_UPDATE, event_data={'action': 'course_assigned', 'course': course_dict, 'tutor_id': tid, 'assigned_by': assigned_by, 'timestamp': timestamp}, affected_entities=[{'type': 'course', 'id': course_id}, {'type': 'user', 'id': tid}])
+def _json(payload, status_code=200):
+    """Serialize payload with orjson when available, falling back to jsonify"""
+    if orjson is not None:
+        return current_app.response_class(orjson.dumps(payload), status=status_code, mimetype='application/json')
+    return (jsonify(payload), status_code)
+def _current_user():
+    """Memoize the authenticated user on flask.g for the request lifetime"""
+    if 'current_user' not in g:
+        g.current_user = User.query.get(get_jwt_identity())
+    return g.current_user
+def _admin_required(func):
+    """Short-circuit with 403 unless the request-scoped user is an admin"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        user = _current_user()
+        if not user or user.account_type != 'admin':
+            return (jsonify({'error': 'Admin access required'}), 403)
+        return func(*args, **kwargs)
+    return wrapper
+@api_bp.route('/courses', methods=['GET'])
+def get_courses():
+    """Get all courses"""
+    try:
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        subject = request.args.get('subject')
+        level = request.args.get('level')
+        grade_level = request.args.get('gradeLevel')
+        status = request.args.get('status', 'active')
+        query = (Course.query.options(selectinload(Course.modules), selectinload(Course.tutors), selectinload(Course.enrollments))).filter_by(status=status)
+        if subject:
+            query = query.filter_by(subject=subject)
+        if level:
+            query = query.filter_by(level=level)
+        if grade_level:
+            query = query.filter_by(grade_level=grade_level)
+        courses = query.paginate(page=page, per_page=per_page, error_out=False)
+        return _json({'courses': [course.to_dict() for course in courses.items], 'totalCourses': courses.total, 'totalPages': courses.pages, 'currentPage': page, 'hasNext': courses.has_next, 'hasPrev': courses.has_prev})
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>', methods=['GET'])
+@jwt_required()
+def get_course(course_id):
+    """Get specific course with enhanced data for admin users"""
+    try:
+        current_user = _current_user()
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        course = Course.query.get(course_id)
+        if not course:
+            return (jsonify({'error': 'Course not found'}), 404)
+        course_data = course.to_dict()
+        course_data['modules'] = [module.to_dict() for module in course.modules]
+        if current_user.account_type == 'admin':
+            start_date = request.args.get('start_date')
+            end_date = request.args.get('end_date')
+            logger.debug('Received date range parameters - start_date: %s, end_date: %s', start_date, end_date)
+            if start_date and end_date:
+                try:
+                    start_date_obj = (datetime.strptime(start_date, '%Y-%m-%d')).date()
+                    end_date_obj = (datetime.strptime(end_date, '%Y-%m-%d')).date()
+                    logger.debug('Parsed dates - start: %s, end: %s', start_date_obj, end_date_obj)
+                    availability_data = AvailabilityService.get_course_tutor_availability(course_id, start_date=start_date_obj, end_date=end_date_obj)
+                except ValueError as ve:
+                    logger.debug('Date parsing error - %s', ve)
+                    return (jsonify({'error': f'Invalid date format. Use YYYY-MM-DD. Error: {str(ve)}'}), 400)
+            else:
+                availability_data = AvailabilityService.get_course_tutor_availability(course_id)
+            course_data['tutors'] = availability_data['tutors']
+            course_data['availabilityDateRange'] = availability_data['dateRange']
+        return (jsonify({'course': course_data}), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses', methods=['POST'])
+@jwt_required()
+@_admin_required
+def create_course():
+    """Create new course (admin only)"""
+    try:
+        data = request.get_json()
+        required_fields = ['title', 'description']
+        for field in required_fields:
+            if not data.get(field):
+                return (jsonify({'error': f'{field} is required'}), 400)
+        course_currency = data.get('currency', 'GBP')
+        if data.get('country') and not data.get('currency'):
+            course_currency = get_currency_from_country(data.get('country'))
+        course = Course(title=data['title'], description=data['description'], price=data.get('price', 0.0), currency=course_currency, duration=data.get('duration'), level=data.get('level'), subject=data.get('subject'), country=data.get('country'), grade_level=data.get('gradeLevel'), thumbnail=data.get('thumbnail'), syllabus=data.get('syllabus', []), prerequisites=data.get('prerequisites', []), learning_outcomes=data.get('learningOutcomes', []))
+        db.session.add(course)
+        db.session.commit()
+        assignment_result = None
+        if course.grade_level and course.subject:
+            assignment_result = TutorAssignmentService.auto_assign_tutors(course)
+        response_data = {'course': course.to_dict(), 'message': 'Course created successfully'}
+        if assignment_result:
+            response_data['tutorAssignment'] = assignment_result
+            if assignment_result['assigned_count'] > 0:
+                response_data['message'] += f" and {assignment_result['assigned_count']} tutor(s) automatically assigned"
+        return (jsonify(response_data), 201)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>', methods=['PUT'])
+@jwt_required()
+@_admin_required
+def update_course(course_id):
+    """Update course (admin only)"""
+    try:
+        data = request.get_json()
+        if 'country' in data and 'currency' not in data:
+            data['currency'] = get_currency_from_country(data['country'])
+        updatable_fields = ['title', 'description', 'price', 'currency', 'duration', 'subject', 'country', 'grade_level', 'status', 'timezone', 'thumbnail', 'syllabus', 'prerequisites', 'learning_outcomes']
+        changes = {}
+        for field in updatable_fields:
+            if field == 'learning_outcomes':
+                if 'learningOutcomes' in data:
+                    changes['learning_outcomes'] = data['learningOutcomes']
+            elif field == 'grade_level':
+                if 'grade_level' in data:
+                    changes['grade_level'] = data['grade_level']
+                elif 'gradeLevel' in data:
+                    changes['grade_level'] = data['gradeLevel']
+            elif field in data:
+                changes[field] = data[field]
+        if changes:
+            result = db.session.execute(sa_update(Course).where(Course.id == course_id).values(**changes))
+            if result.rowcount == 0:
+                db.session.rollback()
+                return (jsonify({'error': 'Course not found'}), 404)
+            db.session.commit()
+        course = Course.query.get(course_id)
+        if not course:
+            return (jsonify({'error': 'Course not found'}), 404)
+        return (jsonify({'course': course.to_dict(), 'message': 'Course updated successfully'}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>', methods=['DELETE'])
+@jwt_required()
+@_admin_required
+def delete_course(course_id):
+    """Delete course (admin only)"""
+    try:
+        course = Course.query.get(course_id)
+        if not course:
+            return (jsonify({'error': 'Course not found'}), 404)
+        db.session.delete(course)
+        db.session.commit()
+        return (jsonify({'message': 'Course deleted successfully'}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>/enroll', methods=['POST'])
+@jwt_required()
+def enroll_in_course(course_id):
+    """Enroll student in course"""
+    try:
+        with db.session.no_autoflush:
+            current_user = _current_user()
+            if not current_user:
+                return (jsonify({'error': 'User not found'}), 404)
+            course = Course.query.get(course_id)
+            if not course:
+                return (jsonify({'error': 'Course not found'}), 404)
+            data = request.get_json() or {}
+            student_id = data.get('studentId', current_user.id)
+            if (db.session.query((Enrollment.query.filter_by(student_id=student_id, course_id=course_id)).exists())).scalar():
+                return (jsonify({'error': 'Already enrolled in this course'}), 400)
+            student = (User.query.options(joinedload(User.credit_allocations))).get(student_id)
+            if not student:
+                return (jsonify({'error': 'Student not found'}), 404)
+            guardian_email = student.profile.get('guardian_email') if student.profile else None
+            guardian_id = None
+            if guardian_email:
+                guardian = (User.query.filter_by(email=guardian_email, account_type='guardian')).first()
+                if guardian:
+                    guardian_id = guardian.id
+        credits_required = course.price if course.price > 0 else 0
+        if credits_required > 0:
+            allocation = student.credit_allocations[0] if student.credit_allocations else None
+            if not allocation:
+                if guardian_id:
+                    notification = Notification(user_id=guardian_id, type='credit_allocation_needed', title='Credit Allocation Required for Course Enrollment', message=f"{student.profile.get('name', student.email)} wants to enroll in \"{course.title}\" which requires {credits_required} credits. Please allocate credits to this student.", data={'student_id': student_id, 'student_name': student.profile.get('name', student.email), 'course_id': course_id, 'course_title': course.title, 'credits_required': credits_required, 'action_required': 'credit_allocation'})
+                    db.session.add(notification)
+                    db.session.commit()
+                    return (jsonify({'error': f'No credit allocation found for student. Guardian has been notified to allocate {credits_required} credits.'}), 400)
+                return (jsonify({'error': 'No credit allocation found for student and no guardian to allocate credits.'}), 400)
+            if allocation.remaining_credits < credits_required:
+                return (jsonify({'error': f'Insufficient credits. Required: {credits_required}, Available: {allocation.remaining_credits}'}), 400)
+            if not allocation.use_credits(credits_required):
+                return (jsonify({'error': 'Failed to use credits'}), 400)
+            transaction = CreditTransaction(guardian_id=allocation.guardian_id, student_id=student_id, allocation_id=allocation.id, transaction_type='course_enrollment', credits=credits_required, description=f'Course enrollment: {course.title}', related_enrollment_id=None)
+            db.session.add(transaction)
+        enrollment = Enrollment(student_id=student_id, course_id=course_id, guardian_id=guardian_id, status='active', credits_used=credits_required)
+        db.session.add(enrollment)
+        db.session.flush()
+        if credits_required > 0:
+            transaction.related_enrollment_id = enrollment.id
+        db.session.commit()
+        cache_manager.delete(f'course:member:{course_id}:{student_id}')
+        return (jsonify({'enrollment': enrollment.to_dict(), 'message': f'Successfully enrolled in course! {credits_required} credits used.', 'credits_used': credits_required, 'remaining_credits': allocation.remaining_credits if credits_required > 0 else None}), 201)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>/tutors', methods=['POST'])
+@jwt_required()
+@_admin_required
+def assign_tutor_to_course(course_id):
+    """Assign single or multiple tutors to course (admin only)"""
+    try:
+        with db.session.no_autoflush:
+            current_user = _current_user()
+            course = (Course.query.options(selectinload(Course.tutors))).get(course_id)
+            if not course:
+                return (jsonify({'error': 'Course not found'}), 404)
+            data = request.get_json()
+            tutor_id = data.get('tutorId')
+            tutor_ids = data.get('tutorIds', [])
+            if tutor_id:
+                tutor_ids = [tutor_id]
+            if not tutor_ids:
+                return (jsonify({'error': 'At least one tutor ID is required'}), 400)
+            tutors_by_id = {u.id: u for u in (User.query.filter(User.id.in_(tutor_ids))).all()}
+            existing_ids = {t.id for t in course.tutors}
+        assigned_tutors = []
+        assigned_tutor_ids = []
+        already_assigned = []
+        not_found = []
+        for tid in tutor_ids:
+            tutor = tutors_by_id.get(tid)
+            if not tutor or not tutor.has_role('tutor'):
+                tutor = None
+            if not tutor:
+                not_found.append(tid)
+                continue
+            if tutor.id in existing_ids:
+                already_assigned.append(tutor.profile.get('name', tutor.email))
+                continue
+            course.tutors.append(tutor)
+            existing_ids.add(tutor.id)
+            assigned_tutors.append(tutor.profile.get('name', tutor.email))
+            assigned_tutor_ids.append(tid)
+        if assigned_tutors:
+            db.session.commit()
+            cache_manager.delete(f'course:tutors:{course_id}')
+            for tid in assigned_tutor_ids:
+                cache_manager.delete(f'course:member:{course_id}:{tid}')
+            AvailabilityService.invalidate_cache(course_id=course_id)
+        course_dict = course.to_dict()
+        if assigned_tutors:
+            logger.debug('Queueing course assignment events for %s tutors', len(assigned_tutor_ids))
+            try:
+                from app import socketio
+                socketio.start_background_task(_broadcast_assignment_events, course_dict, assigned_tutor_ids, current_user.profile.get('name', current_user.email), course_id)
+            except Exception as socket_error:
+                logger.error(f'Failed to queue course assignment events: {str(socket_error)}')
+        messages = []
+        if assigned_tutors:
+            messages.append(f"Successfully assigned {len(assigned_tutors)} tutor(s): {', '.join(assigned_tutors)}")
+        if already_assigned:
+            messages.append(f"Already assigned: {', '.join(already_assigned)}")
+        if not_found:
+            messages.append(f"Tutors not found: {', '.join(not_found)}")
+        return (jsonify({'message': '; '.join(messages), 'assignedCount': len(assigned_tutors), 'alreadyAssignedCount': len(already_assigned), 'notFoundCount': len(not_found), 'course': course_dict}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>/tutors/<string:tutor_id>', methods=['DELETE'])
+@jwt_required()
+@_admin_required
+def remove_tutor_from_course(course_id, tutor_id):
+    """Remove tutor from course (admin only)"""
+    try:
+        course = Course.query.get(course_id)
+        if not course:
+            return (jsonify({'error': 'Course not found'}), 404)
+        assigned = (db.session.query((db.session.query(course_tutors).filter(course_tutors.c.course_id == course_id, course_tutors.c.tutor_id == tutor_id)).exists())).scalar()
+        if not assigned:
+            return (jsonify({'error': 'Tutor not assigned to this course'}), 404)
+        db.session.execute(course_tutors.delete().where((course_tutors.c.course_id == course_id) & (course_tutors.c.tutor_id == tutor_id)))
+        db.session.commit()
+        cache_manager.delete(f'course:tutors:{course_id}')
+        cache_manager.delete(f'course:member:{course_id}:{tutor_id}')
+        AvailabilityService.invalidate_cache(course_id=course_id)
+        return (jsonify({'message': 'Tutor removed from course successfully', 'course': course.to_dict()}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>/tutors/bulk', methods=['POST'])
+@jwt_required()
+@_admin_required
+def bulk_manage_tutors(course_id):
+    """Bulk assign or remove tutors from course (admin only)"""
+    try:
+        with db.session.no_autoflush:
+            course = (Course.query.options(selectinload(Course.tutors))).get(course_id)
+            if not course:
+                return (jsonify({'error': 'Course not found'}), 404)
+            data = request.get_json()
+            action = data.get('action')
+            tutor_ids = data.get('tutorIds', [])
+            if not action or action not in ('assign', 'remove'):
+                return (jsonify({'error': 'Valid action (assign or remove) is required'}), 400)
+            if not tutor_ids:
+                return (jsonify({'error': 'At least one tutor ID is required'}), 400)
+            tutors_by_id = {u.id: u for u in (User.query.filter(User.id.in_(tutor_ids))).all()}
+            existing_ids = {t.id for t in course.tutors}
+        processed_tutors = []
+        processed_tutor_ids = []
+        already_processed = []
+        not_found = []
+        for tid in tutor_ids:
+            tutor = tutors_by_id.get(tid)
+            if not tutor or not tutor.has_role('tutor'):
+                tutor = None
+            if not tutor:
+                not_found.append(tid)
+                continue
+            if action == 'assign':
+                if tutor.id in existing_ids:
+                    already_processed.append(tutor.profile.get('name', tutor.email))
+                    continue
+                course.tutors.append(tutor)
+                existing_ids.add(tutor.id)
+                processed_tutors.append(tutor.profile.get('name', tutor.email))
+                processed_tutor_ids.append(tutor.id)
+            elif action == 'remove':
+                if tutor.id not in existing_ids:
+                    already_processed.append(tutor.profile.get('name', tutor.email))
+                    continue
+                course.tutors.remove(tutor)
+                existing_ids.discard(tutor.id)
+                processed_tutors.append(tutor.profile.get('name', tutor.email))
+                processed_tutor_ids.append(tutor.id)
+        if processed_tutors:
+            db.session.commit()
+            cache_manager.delete(f'course:tutors:{course_id}')
+            for tid in processed_tutor_ids:
+                cache_manager.delete(f'course:member:{course_id}:{tid}')
+            AvailabilityService.invalidate_cache(course_id=course_id)
+        action_word = 'assigned' if action == 'assign' else 'removed'
+        already_word = 'already assigned' if action == 'assign' else 'not assigned'
+        messages = []
+        if processed_tutors:
+            messages.append(f"Successfully {action_word} {len(processed_tutors)} tutor(s): {', '.join(processed_tutors)}")
+        if already_processed:
+            messages.append(f"{already_word.title()}: {', '.join(already_processed)}")
+        if not_found:
+            messages.append(f"Tutors not found: {', '.join(not_found)}")
+        return (jsonify({'message': '; '.join(messages), 'action': action, 'processedCount': len(processed_tutors), 'alreadyProcessedCount': len(already_processed), 'notFoundCount': len(not_found), 'course': course.to_dict()}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>/tutors', methods=['GET'])
+@jwt_required()
+def get_course_tutors(course_id):
+    """Get all tutors assigned to a course"""
+    try:
+        course = Course.query.get(course_id)
+        if not course:
+            return (jsonify({'error': 'Course not found'}), 404)
+        tutor_rows = ((db.session.query(User.id, User.email, User.profile, User.is_active).join(course_tutors, course_tutors.c.tutor_id == User.id)).filter(course_tutors.c.course_id == course_id)).all()
+        tutors_data = [{'id': tid, 'name': (profile or {}).get('name', email), 'email': email, 'subjects': (profile or {}).get('subjects', []), 'rating': (profile or {}).get('rating'), 'totalSessions': (profile or {}).get('totalSessions', 0), 'status': 'active' if is_active else 'inactive'} for (tid, email, profile, is_active) in tutor_rows]
+        return _json({'tutors': tutors_data, 'totalTutors': len(tutors_data), 'courseId': course_id, 'courseTitle': course.title})
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>/students', methods=['GET'])
+@jwt_required()
+def get_course_students(course_id):
+    """Get all students enrolled in a course"""
+    try:
+        current_user = _current_user()
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        if current_user.account_type not in ('admin', 'tutor'):
+            return (jsonify({'error': 'Admin or tutor access required'}), 403)
+        course = Course.query.get(course_id)
+        if not course:
+            return (jsonify({'error': 'Course not found'}), 404)
+        enrollments = ((Enrollment.query.options(joinedload(Enrollment.student))).filter_by(course_id=course_id, status='active')).all()
+        total_modules = len(course.modules) if course.modules else 0
+        students = []
+        for enrollment in enrollments:
+            student_name = enrollment.student.email
+            if hasattr(enrollment.student, 'profile') and enrollment.student.profile:
+                student_name = enrollment.student.profile.get('name', enrollment.student.email)
+            student_data = {'id': enrollment.student.id, 'name': student_name, 'email': enrollment.student.email, 'enrollmentDate': enrollment.enrolled_date.isoformat() if enrollment.enrolled_date else None, 'status': enrollment.status, 'progress': {'completedModules': enrollment.completed_modules if hasattr(enrollment, 'completed_modules') else 0, 'totalModules': total_modules}, 'enrollmentId': enrollment.id}
+            students.append(student_data)
+        return _json({'students': students, 'total': len(students), 'courseId': course_id, 'courseName': course.title})
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/tutor-assignment-preview', methods=['POST'])
+@jwt_required()
+@_admin_required
+def preview_tutor_assignment():
+    """Preview which tutors would be auto-assigned for given course parameters (admin only)"""
+    try:
+        data = request.get_json()
+        grade_level = data.get('gradeLevel')
+        subject = data.get('subject')
+        if not grade_level or not subject:
+            return (jsonify({'error': 'Both gradeLevel and subject are required'}), 400)
+        preview_data = TutorAssignmentService.get_assignment_preview(grade_level, subject)
+        return (jsonify({'preview': preview_data, 'parameters': {'gradeLevel': grade_level, 'subject': subject}}), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>/availability', methods=['GET'])
+@jwt_required()
+@_admin_required
+def get_course_availability(course_id):
+    """Get date-specific tutor availability for a course"""
+    try:
+        course = Course.query.get(course_id)
+        if not course:
+            return (jsonify({'error': 'Course not found'}), 404)
+        module_id = request.args.get('moduleId')
+        availability_data = AvailabilityService.get_course_tutor_availability(course_id=course_id, module_id=module_id)
+        return (jsonify(availability_data), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
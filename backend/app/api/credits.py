@@ -0,0 +1,212 @@
+from flask import request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from app import db
+from app.models import User, CreditBalance, StudentCreditAllocation, CreditTransaction
+from app.api import api_bp
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import joinedload
+from datetime import datetime
+import uuid
+def _jwt_account_type():
+    """Read account_type from the JWT claims, falling back to a user lookup for older tokens"""
+    account_type = (get_jwt()).get('account_type')
+    if account_type is None:
+        user = User.query.get(get_jwt_identity())
+        account_type = user.account_type if user else None
+    return account_type
+@api_bp.route('/credits/balance/<string:guardian_id>/detailed', methods=['GET'])
+@jwt_required()
+def get_guardian_credit_balance(guardian_id):
+    """Get guardian's credit balance with student allocations"""
+    try:
+        current_user_id = get_jwt_identity()
+        if current_user_id != guardian_id and _jwt_account_type() != 'admin':
+            return (jsonify({'error': 'Access denied'}), 403)
+        credit_balance = (CreditBalance.query.filter_by(guardian_id=guardian_id)).first()
+        if not credit_balance:
+            credit_balance = CreditBalance(guardian_id=guardian_id, total_credits=0.0, used_credits=0.0, available_credits=0.0)
+            db.session.add(credit_balance)
+            db.session.commit()
+        allocations = (StudentCreditAllocation.query.filter_by(guardian_id=guardian_id)).all()
+        credit_balance.recalculate_available_credits()
+        if db.session.is_modified(credit_balance):
+            db.session.commit()
+        return (jsonify({'creditBalance': credit_balance.to_dict(), 'studentAllocations': [allocation.to_dict() for allocation in allocations], 'totalAllocated': sum((allocation.allocated_credits for allocation in allocations))}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/credits/allocate', methods=['POST'])
+@jwt_required()
+def allocate_credits_to_student():
+    """Allocate credits from guardian to student"""
+    try:
+        data = request.get_json() or {}
+        student_id = data.get('student_id')
+        credits = data.get('credits', 0)
+        reason = data.get('reason', 'Manual allocation')
+        if not student_id or not isinstance(credits, (int, float)) or credits <= 0:
+            return (jsonify({'error': 'Invalid student_id or credits amount'}), 400)
+        current_user_id = get_jwt_identity()
+        if _jwt_account_type() != 'guardian':
+            return (jsonify({'error': 'Only guardians can allocate credits'}), 403)
+        student = User.query.get(student_id)
+        if not student or student.account_type != 'student':
+            return (jsonify({'error': 'Student not found'}), 404)
+        credit_balance = ((CreditBalance.query.filter_by(guardian_id=current_user_id)).with_for_update()).first()
+        if not credit_balance:
+            return (jsonify({'error': 'No credit balance found'}), 404)
+        if credit_balance.available_credits < credits:
+            return (jsonify({'error': f'Insufficient credits. Available: {credit_balance.available_credits}, Required: {credits}'}), 400)
+        allocation = ((StudentCreditAllocation.query.filter_by(guardian_id=current_user_id, student_id=student_id)).with_for_update()).first()
+        if not allocation:
+            allocation = StudentCreditAllocation(guardian_id=current_user_id, student_id=student_id, allocated_credits=0.0, used_credits=0.0, remaining_credits=0.0, allocation_reason=reason)
+            db.session.add(allocation)
+        if credit_balance.allocate_credits_to_student(credits):
+            allocation.allocate_credits(credits, reason)
+            transaction = CreditTransaction(guardian_id=current_user_id, student_id=student_id, allocation_id=allocation.id, transaction_type='allocation', credits=credits, description=f'Allocated {credits} credits to student: {reason}')
+            db.session.add(transaction)
+            db.session.commit()
+            return (jsonify({'message': f'Successfully allocated {credits} credits to student', 'allocation': allocation.to_dict(), 'creditBalance': credit_balance.to_dict()}), 200)
+        return (jsonify({'error': 'Failed to allocate credits'}), 400)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/credits/allocations/<string:guardian_id>', methods=['GET'])
+@jwt_required()
+def get_student_allocations(guardian_id):
+    """Get all student credit allocations for a guardian"""
+    try:
+        current_user_id = get_jwt_identity()
+        if current_user_id != guardian_id and _jwt_account_type() != 'admin':
+            return (jsonify({'error': 'Access denied'}), 403)
+        allocations = ((StudentCreditAllocation.query.options(joinedload(StudentCreditAllocation.student))).filter_by(guardian_id=guardian_id)).all()
+        result = []
+        for allocation in allocations:
+            student = allocation.student
+            allocation_dict = allocation.to_dict()
+            allocation_dict['studentName'] = student.profile.get('name', student.email) if student and student.profile else student.email if student else 'Unknown'
+            allocation_dict['studentEmail'] = student.email if student else 'Unknown'
+            result.append(allocation_dict)
+        return (jsonify({'allocations': result}), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/credits/use', methods=['POST'])
+@jwt_required()
+def use_student_credits():
+    """Use credits from a student's allocation"""
+    try:
+        current_user_id = get_jwt_identity()
+        data = request.get_json() or {}
+        student_id = data.get('student_id')
+        credits = data.get('credits', 0)
+        usage_type = data.get('usage_type', 'general')
+        description = data.get('description', 'Credit usage')
+        session_id = data.get('session_id')
+        enrollment_id = data.get('enrollment_id')
+        if not student_id or not isinstance(credits, (int, float)) or credits <= 0:
+            return (jsonify({'error': 'Invalid student_id or credits amount'}), 400)
+        allocation = ((StudentCreditAllocation.query.options(joinedload(StudentCreditAllocation.guardian_balance))).filter_by(student_id=student_id)).first()
+        if not allocation:
+            return (jsonify({'error': 'No credit allocation found for student'}), 404)
+        if allocation.use_credits(credits):
+            credit_balance = allocation.guardian_balance
+            if credit_balance:
+                credit_balance.used_credits += credits
+            transaction = CreditTransaction(guardian_id=allocation.guardian_id, student_id=student_id, allocation_id=allocation.id, transaction_type='usage', credits=credits, description=description, related_session_id=session_id, related_enrollment_id=enrollment_id)
+            db.session.add(transaction)
+            db.session.commit()
+            return (jsonify({'message': f'Successfully used {credits} credits', 'allocation': allocation.to_dict(), 'remainingCredits': allocation.remaining_credits}), 200)
+        return (jsonify({'error': f'Insufficient credits. Available: {allocation.remaining_credits}, Required: {credits}'}), 400)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/credits/transfer', methods=['POST'])
+@jwt_required()
+def transfer_credits_between_students():
+    """Transfer credits from one student to another"""
+    try:
+        data = request.get_json() or {}
+        from_student_id = data.get('from_student_id')
+        to_student_id = data.get('to_student_id')
+        credits = data.get('credits', 0)
+        reason = data.get('reason', 'Credit transfer')
+        if not from_student_id or not to_student_id or not isinstance(credits, (int, float)) or credits <= 0:
+            return (jsonify({'error': 'Invalid parameters'}), 400)
+        if from_student_id == to_student_id:
+            return (jsonify({'error': 'Cannot transfer credits to the same student'}), 400)
+        current_user_id = get_jwt_identity()
+        if _jwt_account_type() != 'guardian':
+            return (jsonify({'error': 'Only guardians can transfer credits'}), 403)
+        locked = (((StudentCreditAllocation.query.filter(StudentCreditAllocation.guardian_id == current_user_id, StudentCreditAllocation.student_id.in_((from_student_id, to_student_id)))).order_by(StudentCreditAllocation.id)).with_for_update()).all()
+        allocations_by_student = {a.student_id: a for a in locked}
+        from_allocation = allocations_by_student.get(from_student_id)
+        to_allocation = allocations_by_student.get(to_student_id)
+        if not from_allocation:
+            return (jsonify({'error': 'Source student has no credit allocation'}), 404)
+        if not to_allocation:
+            to_allocation = StudentCreditAllocation(guardian_id=current_user_id, student_id=to_student_id, allocated_credits=0.0, used_credits=0.0, remaining_credits=0.0, allocation_reason=reason)
+            db.session.add(to_allocation)
+        if from_allocation.transfer_credits(credits, to_allocation):
+            db.session.flush()
+            db.session.execute(CreditTransaction.__table__.insert(), [{'guardian_id': current_user_id, 'student_id': from_student_id, 'allocation_id': from_allocation.id, 'transaction_type': 'transfer', 'credits': -credits, 'description': f'Transferred {credits} credits to another student: {reason}'}, {'guardian_id': current_user_id, 'student_id': to_student_id, 'allocation_id': to_allocation.id, 'transaction_type': 'transfer', 'credits': credits, 'description': f'Received {credits} credits from another student: {reason}'}])
+            db.session.commit()
+            return (jsonify({'message': f'Successfully transferred {credits} credits', 'fromAllocation': from_allocation.to_dict(), 'toAllocation': to_allocation.to_dict()}), 200)
+        return (jsonify({'error': f'Insufficient credits to transfer. Available: {from_allocation.remaining_credits}, Required: {credits}'}), 400)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/credits/student-allocations/<string:student_id>', methods=['GET'])
+@jwt_required()
+def get_student_credit_allocations(student_id):
+    """Get all credit allocations for a specific student"""
+    try:
+        current_user_id = get_jwt_identity()
+        if current_user_id != student_id and _jwt_account_type() != 'admin':
+            return (jsonify({'error': 'Access denied'}), 403)
+        allocations = ((StudentCreditAllocation.query.options(joinedload(StudentCreditAllocation.guardian))).filter_by(student_id=student_id)).all()
+        result = []
+        for allocation in allocations:
+            guardian = allocation.guardian
+            allocation_dict = allocation.to_dict()
+            allocation_dict['guardianName'] = guardian.profile.get('name', guardian.email) if guardian and guardian.profile else guardian.email if guardian else 'Unknown'
+            allocation_dict['guardianEmail'] = guardian.email if guardian else 'Unknown'
+            result.append(allocation_dict)
+        return (jsonify(result), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/credits/transactions/<string:guardian_id>', methods=['GET'])
+@jwt_required()
+def get_credit_transactions(guardian_id):
+    """Get credit transaction history for a guardian"""
+    try:
+        current_user_id = get_jwt_identity()
+        if current_user_id != guardian_id and _jwt_account_type() != 'admin':
+            return (jsonify({'error': 'Access denied'}), 403)
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        before_id = request.args.get('before_id')
+        query = (CreditTransaction.query.filter_by(guardian_id=guardian_id)).order_by(CreditTransaction.created_at.desc(), CreditTransaction.id.desc())
+        if before_id:
+            before_created = (db.session.query(CreditTransaction.created_at).filter_by(id=before_id)).scalar()
+            if before_created is not None:
+                query = query.filter(or_(CreditTransaction.created_at < before_created, and_(CreditTransaction.created_at == before_created, CreditTransaction.id < before_id)))
+            rows = (query.limit(per_page + 1)).all()
+            next_cursor = rows[per_page - 1].id if len(rows) > per_page else None
+            items = rows[:per_page]
+        else:
+            transactions = query.paginate(page=page, per_page=per_page, error_out=False)
+            items = transactions.items
+        student_ids = {t.student_id for t in items if t.student_id}
+        student_rows = ((User.query.with_entities(User.id, User.email, User.profile)).filter(User.id.in_(student_ids))).all() if student_ids else []
+        name_by_id = {uid: ((profile.get('name') if profile else None) or email) for uid, email, profile in student_rows}
+        result = []
+        for transaction in items:
+            transaction_dict = transaction.to_dict()
+            if transaction.student_id:
+                transaction_dict['studentName'] = name_by_id.get(transaction.student_id, 'Unknown')
+            result.append(transaction_dict)
+        if before_id:
+            return (jsonify({'transactions': result, 'nextCursor': next_cursor}), 200)
+        return (jsonify({'transactions': result, 'totalTransactions': transactions.total, 'totalPages': transactions.pages, 'currentPage': page, 'hasNext': transactions.has_next, 'hasPrev': transactions.has_prev}), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
@@ -0,0 +1,63 @@
+from flask import request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from app import db
+from app.models import User, CreditBalance, CreditTransaction, Payment
+from app.api import api_bp
+from datetime import datetime
+import logging
+import secrets
+logger = logging.getLogger(__name__)
+def _generate_invoice_async(app, payment_id, guardian_id):
+    """Generate the invoice for a credit addition outside the request thread"""
+    with app.app_context():
+        from app.services.invoice_service import InvoiceService
+        try:
+            InvoiceService.generate_invoice_for_payment(payment_id=payment_id, guardian_id=guardian_id, student_id=None, course_id=None)
+        except Exception as invoice_error:
+            logger.error(f'Failed to generate invoice for credit addition: {invoice_error}')
+@api_bp.route('/credits/add', methods=['POST'])
+@jwt_required()
+def add_credits_to_guardian():
+    """Add credits to guardian account (admin only)"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user or current_user.account_type != 'admin':
+            return (jsonify({'error': 'Admin access required'}), 403)
+        data = request.get_json()
+        if not data:
+            return (jsonify({'error': 'No data provided'}), 400)
+        guardian_id = data.get('guardian_id')
+        amount = data.get('amount')
+        reason = data.get('reason', 'Manual credit addition by admin')
+        if not guardian_id or amount is None:
+            return (jsonify({'error': 'Guardian ID and amount are required'}), 400)
+        if amount <= 0:
+            return (jsonify({'error': 'Amount must be greater than 0'}), 400)
+        guardian = User.query.get(guardian_id)
+        if not guardian or guardian.account_type != 'guardian':
+            return (jsonify({'error': 'Guardian not found'}), 404)
+        credit_balance = (CreditBalance.query.filter_by(guardian_id=guardian_id)).first()
+        if not credit_balance:
+            credit_balance = CreditBalance(guardian_id=guardian_id, total_credits=0.0, used_credits=0.0, available_credits=0.0)
+            db.session.add(credit_balance)
+        id_hex = secrets.token_hex(12)
+        now = datetime.utcnow()
+        payment_id = f'payment_{id_hex[:8]}'
+        payment_row = {'id': payment_id, 'guardian_id': guardian_id, 'amount': 0.0, 'currency': 'GBP', 'method': 'admin_credit', 'status': 'completed', 'transaction_id': f'admin_credit_{id_hex[8:16]}', 'credits_earned': amount, 'processed_at': now}
+        transaction_row = {'id': f'txn_{id_hex[16:24]}', 'guardian_id': guardian_id, 'transaction_type': 'credit_addition', 'credits': amount, 'description': reason, 'created_at': now}
+        credit_balance.add_credits(amount)
+        db.session.execute(Payment.__table__.insert(), [payment_row])
+        db.session.execute(CreditTransaction.__table__.insert(), [transaction_row])
+        db.session.commit()
+        try:
+            from app import socketio
+            socketio.start_background_task(_generate_invoice_async, current_app._get_current_object(), payment_id, guardian_id)
+        except Exception as socket_error:
+            logger.error(f'Failed to queue invoice generation for payment {payment_id}: {str(socket_error)}')
+        payment_dict = {'id': payment_id, 'invoiceId': None, 'guardianId': guardian_id, 'amount': 0.0, 'currency': 'GBP', 'method': 'admin_credit', 'status': 'completed', 'transactionId': payment_row['transaction_id'], 'gatewayResponse': {}, 'creditsEarned': amount, 'processedAt': now.isoformat()}
+        transaction_dict = {'id': transaction_row['id'], 'guardianId': guardian_id, 'studentId': None, 'allocationId': None, 'transactionType': 'credit_addition', 'credits': amount, 'description': reason, 'relatedSessionId': None, 'relatedEnrollmentId': None, 'createdAt': now.isoformat()}
+        return (jsonify({'message': f'{amount} credits added successfully to guardian account', 'credit_balance': credit_balance.to_dict(), 'transaction': transaction_dict, 'payment': payment_dict, 'invoice_created': 'pending'}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
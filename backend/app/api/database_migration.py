@@ -0,0 +1,63 @@
+"""
+Database Migration Endpoint
+Temporary endpoint to run database migrations
+"""
+from flask import request, jsonify
+from app import db
+from app.api import api_bp
+from sqlalchemy import text
+import hmac
+import os
+import logging
+logger = logging.getLogger(__name__)
+_EXPECTED_SECRET = (os.environ.get('ADMIN_SECRET', 'admin123')).encode()
+@api_bp.route('/run-migration', methods=['POST'])
+def run_migration():
+    """
+    Run database migration to add missing columns.
+    Protected by admin secret.
+    """
+    try:
+        admin_secret = request.headers.get('X-Admin-Secret')
+        if not admin_secret or not hmac.compare_digest(admin_secret.encode(), _EXPECTED_SECRET):
+            return (jsonify({'error': 'Unauthorized'}), 401)
+        logger.info('Running database migration...')
+        migration_results = []
+        columns_to_add = [('temp_password_hash', 'VARCHAR(255) DEFAULT NULL'), ('temp_password_expires_at', 'TIMESTAMP DEFAULT NULL'), ('force_password_change', 'BOOLEAN DEFAULT FALSE'), ('temp_password_created_by', 'VARCHAR(50) DEFAULT NULL')]
+        existing = {row[0] for row in db.session.execute(text("\n            SELECT column_name FROM information_schema.columns\n            WHERE table_name = 'users';\n        "))}
+        missing = [(name, ddl) for name, ddl in columns_to_add if name not in existing]
+        for name, _ in columns_to_add:
+            if name in existing:
+                migration_results.append({'step': f'Add {name} column', 'status': 'skipped', 'message': 'Column already exists'})
+                logger.info(f'⚠ Add {name} column - already exists')
+        if missing:
+            clauses = ', '.join((f'ADD COLUMN IF NOT EXISTS {name} {ddl}' for name, ddl in missing))
+            try:
+                db.session.execute(text(f'ALTER TABLE users {clauses};'))
+                db.session.commit()
+                for name, _ in missing:
+                    migration_results.append({'step': f'Add {name} column', 'status': 'success'})
+                    logger.info(f'✓ Add {name} column')
+            except Exception as e:
+                db.session.rollback()
+                error_msg = str(e)
+                for name, _ in missing:
+                    migration_results.append({'step': f'Add {name} column', 'status': 'error', 'error': error_msg})
+                logger.error(f'✗ Batched column add failed - {error_msg}')
+        try:
+            db.session.execute(text('\n                ALTER TABLE users\n                ADD CONSTRAINT fk_temp_password_creator \n                FOREIGN KEY (temp_password_created_by) \n                REFERENCES users(id)\n                ON DELETE SET NULL;\n            '))
+            db.session.commit()
+            migration_results.append({'step': 'Add foreign key constraint', 'status': 'success'})
+        except Exception as e:
+            if 'already exists' in (str(e)).lower():
+                migration_results.append({'step': 'Add foreign key constraint', 'status': 'skipped', 'message': 'Constraint already exists'})
+            else:
+                migration_results.append({'step': 'Add foreign key constraint', 'status': 'warning', 'message': str(e)})
+            db.session.rollback()
+        result = db.session.execute(text("\n            SELECT column_name, data_type\n            FROM information_schema.columns\n            WHERE table_name = 'users'\n            AND column_name IN ('temp_password_hash', 'temp_password_expires_at', \n                               'force_password_change', 'temp_password_created_by')\n            ORDER BY column_name;\n        "))
+        columns = [{'name': row[0], 'type': row[1]} for row in result]
+        logger.info(f'Migration completed. Found {len(columns)} columns')
+        return (jsonify({'success': True, 'message': 'Migration completed', 'migration_results': migration_results, 'verified_columns': columns, 'columns_count': len(columns), 'expected_count': 4}), 200)
+    except Exception as e:
+        logger.error(f'Migration failed: {str(e)}')
+        return (jsonify({'error': 'Migration failed', 'details': str(e)}), 500)
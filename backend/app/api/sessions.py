@@ -0,0 +1,627 @@
+from flask import request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
+from app.api import api_bp
+from app.models import User, Course, Module, Session, Enrollment, Lesson, StudentCreditAllocation, CreditTransaction
+from app.utils.currency import get_currency_from_country
+from app import db
+import uuid
+from datetime import datetime
+@api_bp.route('/sessions', methods=['GET'])
+@jwt_required()
+def get_sessions():
+    """Get sessions based on user role"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        status = request.args.get('status')
+        lesson_id = request.args.get('lessonId')
+        course_id = request.args.get('courseId')
+        query = Session.query
+        if status:
+            query = query.filter_by(status=status)
+        if lesson_id:
+            query = query.filter_by(lesson_id=lesson_id)
+        if course_id:
+            query = query.filter_by(course_id=course_id)
+        if current_user.account_type == 'tutor':
+            query = query.filter_by(tutor_id=current_user_id)
+        else:
+            if current_user.account_type == 'student':
+                if lesson_id:
+                    lesson = Lesson.query.get(lesson_id)
+                    if lesson and lesson.module and lesson.module.course:
+                        course_id = lesson.module.course.id
+                        enrollment = (Enrollment.query.filter_by(student_id=current_user_id, course_id=course_id, status='active')).first()
+                        if enrollment:
+                            query = query.filter_by(lesson_id=lesson_id)
+                        else:
+                            query = query.filter(Session.id == None)
+                    else:
+                        query = query.filter(Session.id == None)
+                else:
+                    if course_id:
+                        enrollment = (Enrollment.query.filter_by(student_id=current_user_id, course_id=course_id, status='active')).first()
+                        if enrollment:
+                            query = query.filter_by(course_id=course_id)
+                        else:
+                            query = query.filter(Session.id == None)
+                    else:
+                        enrolled_courses = (db.session.query(Enrollment.course_id)).filter_by(student_id=current_user_id, status='active')
+                        query = query.filter(Session.course_id.in_(enrolled_courses))
+            elif current_user.account_type != 'admin':
+                enrolled_students = (db.session.query(Enrollment.student_id)).filter_by(guardian_id=current_user_id)
+                query = (query.join(Session.students)).filter(User.id.in_(enrolled_students))
+        sessions = (query.order_by(Session.scheduled_date.desc())).paginate(page=page, per_page=per_page, error_out=False)
+        user_timezone = request.headers.get('X-Timezone', 'UTC')
+        return (jsonify({'sessions': [session.to_dict(user_timezone=user_timezone) for session in sessions.items], 'totalSessions': sessions.total, 'totalPages': sessions.pages, 'currentPage': page, 'hasNext': sessions.has_next, 'hasPrev': sessions.has_prev}), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/<string:session_id>', methods=['GET'])
+@jwt_required()
+def get_session(session_id):
+    """Get specific session"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        session = Session.query.get(session_id)
+        if not session:
+            return (jsonify({'error': 'Session not found'}), 404)
+        has_access = current_user.account_type == 'admin' or session.tutor_id == current_user_id or current_user in session.students
+        if not has_access:
+            return (jsonify({'error': 'Access denied'}), 403)
+        user_timezone = request.headers.get('X-Timezone', 'UTC')
+        session_data = session.to_dict(user_timezone=user_timezone)
+        if current_user.account_type in ('tutor', 'admin'):
+            session_data['enrolledStudents'] = [{'id': student.id, 'name': student.profile.get('name', student.email)} for student in session.students]
+        return (jsonify({'session': session_data}), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions', methods=['POST'])
+@jwt_required()
+def create_session():
+    """Create new session"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user or current_user.account_type not in ('admin', 'tutor'):
+            return (jsonify({'error': 'Admin or tutor access required'}), 403)
+        data = request.get_json()
+        required_fields = ['title', 'scheduledDate']
+        for field in required_fields:
+            if not data.get(field):
+                return (jsonify({'error': f'{field} is required'}), 400)
+        user_timezone = request.headers.get('X-Timezone', 'UTC')
+        browser_locale = request.headers.get('X-Browser-Locale', 'en-US')
+        from app.timezone_utils import smart_parse_session_datetime, validate_future_datetime
+        parse_result = smart_parse_session_datetime(data, user_timezone)
+        if parse_result['errors']:
+            return (jsonify({'error': 'Invalid date/time format', 'details': parse_result['errors']}), 400)
+        scheduled_date = parse_result['utc_datetime']
+        future_validation = validate_future_datetime(scheduled_date.strftime('%Y-%m-%d'), scheduled_date.strftime('%H:%M'), 'UTC', min_advance_minutes=5)
+        if not future_validation['valid']:
+            return (jsonify({'error': 'Invalid booking time', 'details': future_validation['errors']}), 400)
+        tutor_id = data.get('tutorId', current_user_id)
+        if current_user.account_type == 'tutor' and tutor_id != current_user_id:
+            return (jsonify({'error': 'Tutors can only create sessions for themselves'}), 403)
+        session_currency = data.get('currency', 'GBP')
+        if data.get('courseId') and not data.get('currency'):
+            course = Course.query.get(data.get('courseId'))
+            if course:
+                session_currency = course.currency or get_currency_from_country(course.country)
+        session = Session(id=f'session_{(uuid.uuid4()).hex[:8]}', course_id=data.get('courseId'), module_id=data.get('moduleId'), lesson_id=data.get('lessonId'), tutor_id=tutor_id, availability_id=data.get('availability_id'), title=data['title'], description=data.get('description'), scheduled_date=scheduled_date, timezone=parse_result['display_timezone'], created_timezone=user_timezone, browser_timezone=user_timezone, duration=data.get('duration', 60), meeting_link=data.get('meetingLink'), topic=data.get('topic'), max_students=data.get('maxStudents', 5), price=data.get('price', 0.0), currency=session_currency)
+        db.session.add(session)
+        db.session.commit()
+        zoom_success = False
+        zoom_error = None
+        try:
+            from app.services.zoom_service import zoom_service
+            from flask import current_app
+            if zoom_service.is_configured() and current_app.config.get('ZOOM_AUTO_CREATE_MEETINGS', True):
+                course_data = {}
+                if session.course_id:
+                    course = Course.query.get(session.course_id)
+                    if course:
+                        course_data = {'title': course.title, 'subject': course.subject}
+                session_data = {'title': session.title, 'scheduledDate': parse_result['zoom_start_time'] or session.scheduled_date.isoformat() + 'Z', 'duration': session.duration, 'timezone': parse_result['zoom_timezone'], 'topic': session.topic or session.title}
+                zoom_result = zoom_service.create_course_session_meeting(course_data, session_data)
+                if zoom_result.get('success'):
+                    session.meeting_id = zoom_result.get('meeting_id')
+                    session.meeting_link = zoom_result.get('join_url')
+                    session.meeting_password = zoom_result.get('password')
+                    session.meeting_start_url = zoom_result.get('start_url')
+                    session.meeting_uuid = zoom_result.get('uuid')
+                    db.session.commit()
+                    zoom_success = True
+                else:
+                    zoom_error = zoom_result.get('error', 'Unknown Zoom API error')
+        except Exception as e:
+            zoom_error = str(e)
+            print(f'Warning: Failed to create Zoom meeting for session {session.id}: {e}')
+        response_data = {'session': session.to_dict(user_timezone=user_timezone), 'message': 'Session created successfully', 'zoom_integration': {'enabled': zoom_service.is_configured() if 'zoom_service' in locals() else False, 'success': zoom_success, 'meeting_created': zoom_success}}
+        if zoom_error and not zoom_success:
+            response_data['zoom_integration']['error'] = zoom_error
+            response_data['message'] += ' (Zoom meeting creation failed - can be added manually)'
+        return (jsonify(response_data), 201)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/<string:session_id>', methods=['PUT'])
+@jwt_required()
+def update_session(session_id):
+    """Update session"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        session = Session.query.get(session_id)
+        if not session:
+            return (jsonify({'error': 'Session not found'}), 404)
+        if current_user.account_type != 'admin' and session.tutor_id != current_user_id:
+            return (jsonify({'error': 'Access denied'}), 403)
+        data = request.get_json()
+        updatable_fields = ['title', 'description', 'scheduled_date', 'duration', 'status', 'meeting_link', 'topic', 'max_students', 'price', 'currency']
+        for field in updatable_fields:
+            if field in data:
+                if field == 'scheduled_date':
+                    try:
+                        scheduled_date = datetime.fromisoformat(data['scheduledDate'].replace('Z', '+00:00'))
+                        session.scheduled_date = scheduled_date
+                    except ValueError:
+                        return (jsonify({'error': 'Invalid date format'}), 400)
+                elif not field == 'scheduledDate':
+                    setattr(session, field, data[field])
+        db.session.commit()
+        return (jsonify({'session': session.to_dict(), 'message': 'Session updated successfully'}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/<string:session_id>', methods=['DELETE'])
+@jwt_required()
+def delete_session(session_id):
+    """Delete session"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        session = Session.query.get(session_id)
+        if not session:
+            return (jsonify({'error': 'Session not found'}), 404)
+        if current_user.account_type != 'admin' and session.tutor_id != current_user_id:
+            return (jsonify({'error': 'Access denied'}), 403)
+        db.session.delete(session)
+        db.session.commit()
+        return (jsonify({'message': 'Session deleted successfully'}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/<string:session_id>/enroll', methods=['POST'])
+@jwt_required()
+def enroll_in_session(session_id):
+    """Enroll student in session"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        session = Session.query.get(session_id)
+        if not session:
+            return (jsonify({'error': 'Session not found'}), 404)
+        data = request.get_json()
+        student_id = data.get('studentId', current_user_id)
+        student = (User.query.filter_by(id=student_id, account_type='student')).first()
+        if not student:
+            return (jsonify({'error': 'Student not found'}), 404)
+        if student in session.students:
+            return (jsonify({'error': 'Already enrolled in this session'}), 400)
+        if not session.can_accept_enrollment():
+            if session.is_full():
+                return (jsonify({'error': 'Session is full', 'details': {'enrollmentCount': session.get_enrollment_count(), 'maxStudents': session.max_students, 'capacityStatus': session.get_capacity_status()}}), 400)
+            return (jsonify({'error': 'Session cannot accept new enrollments', 'details': {'sessionStatus': session.status, 'capacityStatus': session.get_capacity_status()}}), 400)
+        credits_required = session.price if session.price > 0 else 0
+        if credits_required > 0:
+            allocation = (StudentCreditAllocation.query.filter_by(student_id=student_id)).first()
+            if not allocation:
+                return (jsonify({'error': f'No credit allocation found for student. {credits_required} credits required for this session.'}), 400)
+            if allocation.remaining_credits < credits_required:
+                return (jsonify({'error': f'Insufficient credits. Required: {credits_required}, Available: {allocation.remaining_credits}'}), 400)
+            if not allocation.use_credits(credits_required):
+                return (jsonify({'error': 'Failed to use credits'}), 400)
+            transaction = CreditTransaction(guardian_id=allocation.guardian_id, student_id=student_id, allocation_id=allocation.id, transaction_type='session_enrollment', credits=credits_required, description=f'Session enrollment: {session.title}', related_session_id=session.id)
+            db.session.add(transaction)
+        session.students.append(student)
+        db.session.commit()
+        return (jsonify({'message': f'Enrolled in session successfully! {credits_required} credits used.' if credits_required > 0 else 'Enrolled in session successfully!', 'session': session.to_dict(current_student_id=student_id), 'credits_used': credits_required, 'remaining_credits': allocation.remaining_credits if credits_required > 0 else None}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/<string:session_id>/unenroll', methods=['POST'])
+@jwt_required()
+def unenroll_from_session(session_id):
+    """Unenroll student from session"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        session = Session.query.get(session_id)
+        if not session:
+            return (jsonify({'error': 'Session not found'}), 404)
+        data = request.get_json()
+        student_id = data.get('studentId', current_user_id)
+        student = User.query.get(student_id)
+        if not student or student not in session.students:
+            return (jsonify({'error': 'Student not enrolled in this session'}), 404)
+        session.students.remove(student)
+        db.session.commit()
+        return (jsonify({'message': 'Unenrolled from session successfully', 'session': session.to_dict()}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/<string:session_id>/cancel-enrollment', methods=['POST'])
+@jwt_required()
+def cancel_session_enrollment(session_id):
+    """Cancel student enrollment and refund credits"""
+    try:
+        from datetime import datetime, timedelta
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        session = Session.query.get(session_id)
+        if not session:
+            return (jsonify({'error': 'Session not found'}), 404)
+        data = request.get_json()
+        student_id = data.get('studentId', current_user_id)
+        student = (User.query.filter_by(id=student_id, account_type='student')).first()
+        if not student:
+            return (jsonify({'error': 'Student not found'}), 404)
+        if student not in session.students:
+            return (jsonify({'error': 'Student is not enrolled in this session'}), 400)
+        now = datetime.utcnow()
+        session_time = session.scheduled_date
+        hours_until_session = (session_time - now).total_seconds() / 3600
+        if hours_until_session < 24:
+            return (jsonify({'error': f'Cannot cancel session. Must cancel at least 24 hours before session starts. Only {hours_until_session:.1f} hours remaining.'}), 400)
+        credits_to_refund = session.price if session.price > 0 else 0
+        allocation = (StudentCreditAllocation.query.filter_by(student_id=student_id)).first()
+        if credits_to_refund > 0 and allocation:
+            allocation.remaining_credits += credits_to_refund
+            allocation.used_credits -= credits_to_refund
+            refund_transaction = CreditTransaction(guardian_id=allocation.guardian_id, student_id=student_id, allocation_id=allocation.id, transaction_type='session_cancellation', credits=credits_to_refund, description=f'Session cancellation refund: {session.title}', related_session_id=session.id)
+            db.session.add(refund_transaction)
+        session.students.remove(student)
+        db.session.commit()
+        return (jsonify({'message': f'Session cancelled successfully! {credits_to_refund} credits refunded.' if credits_to_refund > 0 else 'Session cancelled successfully!', 'session': session.to_dict(), 'credits_refunded': credits_to_refund, 'remaining_credits': allocation.remaining_credits if allocation else None}), 200)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/upcoming', methods=['GET'])
+@jwt_required()
+def get_upcoming_sessions():
+    """Get upcoming sessions for a user"""
+    try:
+        user_id = request.args.get('userId')
+        user_type = request.args.get('userType')
+        if not user_id or not user_type:
+            return (jsonify({'error': 'userId and userType are required'}), 400)
+        user = User.query.get(user_id)
+        if not user:
+            return (jsonify({'error': 'User not found'}), 404)
+        now = datetime.utcnow()
+        query = Session.query.filter(Session.scheduled_date >= now)
+        if user_type == 'tutor':
+            query = (query.filter_by(tutor_id=user_id)).filter(Session.availability_id.isnot(None))
+        else:
+            if user_type == 'student':
+                query = (query.join(Session.students)).filter(User.id == user_id)
+            elif user_type == 'guardian':
+                enrolled_students = (db.session.query(Enrollment.student_id)).filter_by(guardian_id=user_id)
+                query = (query.join(Session.students)).filter(User.id.in_(enrolled_students))
+        sessions = ((query.order_by(Session.scheduled_date.asc())).limit(10)).all()
+        formatted_sessions = []
+        for session in sessions:
+            session_data = session.to_dict(current_student_id=user_id if user_type == 'student' else None)
+            if session.course_id:
+                course = Course.query.get(session.course_id)
+                if course:
+                    session_data['course'] = course.title
+                    session_data['subject'] = course.subject
+            if session.module_id:
+                module = Module.query.get(session.module_id)
+                if module:
+                    session_data['module'] = module.title
+            if session.scheduled_date:
+                session_data['date'] = session.scheduled_date.strftime('%a, %b %d, %Y')
+                session_data['time'] = session.scheduled_date.strftime('%I:%M %p')
+                session_data['scheduled_date'] = session.scheduled_date.isoformat()
+            if user_type == 'tutor':
+                session_data['studentName'] = ', '.join([s.profile.get('name', s.email) for s in session.students]) if session.students else 'No students enrolled'
+                session_data['enrolledCount'] = len(session.students)
+                session_data['enrolledStudents'] = [{'id': s.id, 'name': s.profile.get('name', s.email), 'email': s.email, 'grade': s.profile.get('grade', ''), 'avatar': s.profile.get('avatar', '/images/default-avatar.png')} for s in session.students]
+            if user_type == 'student' and session.tutor_id:
+                tutor = User.query.get(session.tutor_id)
+                if tutor:
+                    session_data['tutorName'] = tutor.profile.get('name', tutor.email)
+            session_data['meetingId'] = session.meeting_id or f'123-456-{session.id[-3:]}'
+            session_data['meetingLink'] = session.meeting_link or f'https://zoom.us/j/123456{session.id[-3:]}'
+            session_data['meetingPassword'] = session.meeting_password or 'tutorpass123'
+            session_data['meetingStartUrl'] = session.meeting_start_url or f'https://zoom.us/s/123456{session.id[-3:]}?role=1'
+            session_data['meetingUuid'] = session.meeting_uuid or f'uuid-{session.id}'
+            if session.availability_id:
+                session_data['availabilityId'] = session.availability_id
+            formatted_sessions.append(session_data)
+        return (jsonify(formatted_sessions), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/history', methods=['GET'])
+@jwt_required()
+def get_session_history():
+    """Get session history for a user"""
+    try:
+        user_id = request.args.get('userId')
+        user_type = request.args.get('userType')
+        if not user_id or not user_type:
+            return (jsonify({'error': 'userId and userType are required'}), 400)
+        user = User.query.get(user_id)
+        if not user:
+            return (jsonify({'error': 'User not found'}), 404)
+        now = datetime.utcnow()
+        query = Session.query.filter(Session.scheduled_date < now)
+        if user_type == 'tutor':
+            query = query.filter_by(tutor_id=user_id)
+        else:
+            if user_type == 'student':
+                query = (query.join(Session.students)).filter(User.id == user_id)
+            elif user_type == 'guardian':
+                enrolled_students = (db.session.query(Enrollment.student_id)).filter_by(guardian_id=user_id)
+                query = (query.join(Session.students)).filter(User.id.in_(enrolled_students))
+        sessions = ((query.order_by(Session.scheduled_date.desc())).limit(20)).all()
+        print(f'🔍 Session history API - Found {len(sessions)} sessions for user {user_id} (type: {user_type})')
+        for session in sessions[:3]:
+            print(f'  - {session.id}: status={session.status}, date={session.scheduled_date}')
+        formatted_sessions = []
+        for session in sessions:
+            session_data = session.to_dict(current_student_id=user_id if user_type == 'student' else None)
+            if session.course_id:
+                course = Course.query.get(session.course_id)
+                if course:
+                    session_data['course'] = course.title
+                    session_data['subject'] = course.subject
+            if session.module_id:
+                module = Module.query.get(session.module_id)
+                if module:
+                    session_data['module'] = module.title
+            if session.scheduled_date:
+                session_data['date'] = session.scheduled_date.strftime('%a, %b %d, %Y')
+                session_data['time'] = session.scheduled_date.strftime('%I:%M %p')
+                session_data['completedDate'] = session.scheduled_date.strftime('%Y-%m-%d')
+                session_data['scheduled_date'] = session.scheduled_date.isoformat()
+            if user_type == 'tutor':
+                session_data['studentName'] = ', '.join([s.profile.get('name', s.email) for s in session.students]) if session.students else 'No students'
+                session_data['enrolledCount'] = len(session.students)
+                session_data['enrolledStudents'] = [{'id': s.id, 'name': s.profile.get('name', s.email), 'email': s.email, 'grade': s.profile.get('grade', ''), 'avatar': s.profile.get('avatar', '/images/default-avatar.png')} for s in session.students]
+                session_data['feedbackRequested'] = True
+            if user_type == 'student' and session.tutor_id:
+                tutor = User.query.get(session.tutor_id)
+                if tutor:
+                    session_data['tutorName'] = tutor.profile.get('name', tutor.email)
+            session_data['meetingId'] = session.meeting_id or f'123-456-{session.id[-3:]}'
+            session_data['meetingLink'] = session.meeting_link or f'https://zoom.us/j/123456{session.id[-3:]}'
+            session_data['meetingPassword'] = session.meeting_password or 'tutorpass123'
+            session_data['meetingStartUrl'] = session.meeting_start_url or f'https://zoom.us/s/123456{session.id[-3:]}?role=1'
+            session_data['meetingUuid'] = session.meeting_uuid or f'uuid-{session.id}'
+            if session.availability_id:
+                session_data['availabilityId'] = session.availability_id
+            session_data['topic'] = session.topic or session.title
+            formatted_sessions.append(session_data)
+        print(f'🔍 Session history API - Returning {len(formatted_sessions)} formatted sessions')
+        if formatted_sessions:
+            for session in formatted_sessions[:2]:
+                print(f"  - Response: {session.get('id', 'no_id')}: status={session.get('status', 'no_status')}")
+        return (jsonify(formatted_sessions), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>/sessions', methods=['GET'])
+def get_course_sessions(course_id):
+    """Get all sessions for a specific course"""
+    try:
+        verify_jwt_in_request(optional=True)
+        current_user_id = get_jwt_identity()
+    except:
+        current_user_id = None
+    try:
+        current_user = User.query.get(current_user_id) if current_user_id else None
+        course = Course.query.get(course_id)
+        if not course:
+            return (jsonify({'error': 'Course not found'}), 404)
+        query = Session.query.filter_by(course_id=course_id)
+        if current_user:
+            if current_user.account_type == 'student':
+                query = (query.outerjoin(Session.students)).filter((User.id == current_user_id) | Session.status.in_(['scheduled', 'active']))
+            elif current_user.account_type == 'tutor':
+                tutor_courses = [t.id for t in current_user.taught_courses]
+                if course_id in tutor_courses:
+                    pass
+                else:
+                    query = query.filter_by(tutor_id=current_user_id)
+        else:
+            query = query.filter(Session.status.in_(['scheduled', 'active']))
+        sessions = (query.order_by(Session.scheduled_date.asc())).all()
+        sessions_data = []
+        for session in sessions:
+            session_data = session.to_dict(current_student_id=current_user_id if current_user and current_user.account_type == 'student' else None)
+            session_data['enrolledStudentsCount'] = len(session.students)
+            if session.tutor:
+                session_data['tutorName'] = session.tutor.profile.get('name', session.tutor.email)
+                session_data['tutorEmail'] = session.tutor.email
+            if session.module_id:
+                module = Module.query.get(session.module_id)
+                if module:
+                    session_data['moduleName'] = module.title
+            if session.lesson_id:
+                lesson = Lesson.query.get(session.lesson_id)
+                if lesson:
+                    session_data['lessonName'] = lesson.title
+            sessions_data.append(session_data)
+        return (jsonify({'sessions': sessions_data, 'totalSessions': len(sessions_data), 'courseId': course_id, 'courseTitle': course.title}), 200)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/courses/<string:course_id>/sessions/batch', methods=['POST'])
+@jwt_required()
+def create_batch_sessions(course_id):
+    """Create multiple sessions for a course"""
+    try:
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user or current_user.account_type not in ('admin', 'tutor'):
+            return (jsonify({'error': 'Admin or tutor access required'}), 403)
+        course = Course.query.get(course_id)
+        if not course:
+            return (jsonify({'error': 'Course not found'}), 404)
+        data = request.get_json()
+        sessions_data = data.get('sessions', [])
+        if not sessions_data:
+            return (jsonify({'error': 'No sessions data provided'}), 400)
+        created_sessions = []
+        errors = []
+        conflicts = []
+        for session_data in sessions_data:
+            try:
+                title = session_data.get('title')
+                scheduled_date_str = session_data.get('scheduledDate')
+                if not title:
+                    errors.append('Missing title for session')
+                    continue
+                if not scheduled_date_str:
+                    errors.append(f'Missing scheduledDate for session: {title}')
+                    continue
+                try:
+                    user_timezone = request.headers.get('X-Timezone', 'UTC')
+                    parse_result = smart_parse_session_datetime(session_data, user_timezone)
+                    if parse_result['errors']:
+                        errors.append(f"Invalid date/time format for session {title}: {', '.join(parse_result['errors'])}")
+                        continue
+                    scheduled_date = parse_result['utc_datetime']
+                    timezone_str = parse_result['display_timezone']
+                except Exception as e:
+                    errors.append(f'Date parsing error for session {title}: {str(e)}')
+                    continue
+                tutor_id = session_data.get('tutorId')
+                if not tutor_id:
+                    errors.append(f'Missing tutorId for session: {title}')
+                    continue
+                if current_user.account_type == 'tutor' and tutor_id != current_user_id:
+                    errors.append(f'Tutors can only create sessions for themselves: {title}')
+                    continue
+                existing_session = (Session.query.filter_by(tutor_id=tutor_id, scheduled_date=scheduled_date)).first()
+                if existing_session:
+                    conflicts.append(f'Time conflict for {title} - tutor already has session at {scheduled_date}')
+                    continue
+                session = Session(id=f'session_{(uuid.uuid4()).hex[:8]}', course_id=course_id, module_id=session_data.get('moduleId'), lesson_id=session_data.get('lessonId'), tutor_id=tutor_id, availability_id=session_data.get('availability_id'), title=title, description=session_data.get('description'), scheduled_date=scheduled_date, timezone=timezone_str, duration=session_data.get('duration', 60), meeting_link=session_data.get('meetingLink'), topic=session_data.get('topic'), max_students=session_data.get('maxStudents', 5), price=session_data.get('price', 0.0), status=session_data.get('status', 'scheduled'))
+                db.session.add(session)
+                try:
+                    from app.services.zoom_service import zoom_service
+                    from flask import current_app
+                    if zoom_service.is_configured() and current_app.config.get('ZOOM_AUTO_CREATE_MEETINGS', True):
+                        course_data = {'title': course.title, 'subject': course.subject}
+                        zoom_session_data = {'title': session.title, 'scheduledDate': parse_result['zoom_start_time'] or session.scheduled_date.isoformat() + 'Z', 'duration': session.duration, 'timezone': parse_result['zoom_timezone'], 'topic': session.topic or session.title}
+                        zoom_result = zoom_service.create_course_session_meeting(course_data, zoom_session_data)
+                        if zoom_result.get('success'):
+                            session.meeting_id = zoom_result.get('meeting_id')
+                            session.meeting_link = zoom_result.get('join_url')
+                            session.meeting_password = zoom_result.get('password')
+                            session.meeting_start_url = zoom_result.get('start_url')
+                            session.meeting_uuid = zoom_result.get('uuid')
+                except Exception as zoom_error:
+                    print(f'Warning: Failed to create Zoom meeting for batch session {session.id}: {zoom_error}')
+                created_sessions.append(session)
+                continue
+            except Exception as session_error:
+                errors.append(f"Error creating session {session_data.get('title', 'Unknown')}: {str(session_error)}")
+                continue
+        if created_sessions:
+            db.session.commit()
+        response_data = {'message': f'Created {len(created_sessions)} sessions with {len(conflicts)} conflicts and {len(errors)} errors', 'created_count': len(created_sessions), 'total_requested': len(sessions_data), 'created_sessions': [session.to_dict() for session in created_sessions], 'conflicts': conflicts, 'errors': errors}
+        if len(created_sessions) == 0:
+            return (jsonify(response_data), 400)
+        if len(errors) > 0 or len(conflicts) > 0:
+            return (jsonify(response_data), 207)
+        return (jsonify(response_data), 201)
+    except Exception as e:
+        db.session.rollback()
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/<session_id>/start', methods=['POST'])
+@jwt_required()
+def start_session(session_id):
+    """Mark a session as in progress when tutor starts it"""
+    try:
+        from app.services.session_status_service import session_status_service
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        session = Session.query.get(session_id)
+        if not session:
+            return (jsonify({'error': 'Session not found'}), 404)
+        if current_user.account_type not in ('tutor', 'admin') and session.tutor_id != current_user_id:
+            return (jsonify({'error': 'Unauthorized'}), 403)
+        success = session_status_service.mark_session_in_progress(session_id)
+        if success:
+            return (jsonify({'message': 'Session started successfully', 'session_id': session_id, 'status': 'in_progress'}), 200)
+        return (jsonify({'error': 'Could not start session'}), 400)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/<session_id>/complete', methods=['POST'])
+@jwt_required()
+def complete_session(session_id):
+    """Mark a session as completed"""
+    try:
+        from app.services.session_status_service import session_status_service
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        session = Session.query.get(session_id)
+        if not session:
+            return (jsonify({'error': 'Session not found'}), 404)
+        if current_user.account_type not in ('tutor', 'admin') and session.tutor_id != current_user_id:
+            return (jsonify({'error': 'Unauthorized'}), 403)
+        data = request.get_json() or {}
+        participants_count = data.get('participants_count')
+        success = session_status_service.complete_session(session_id, participants_count)
+        if success:
+            return (jsonify({'message': 'Session completed successfully', 'session_id': session_id, 'status': 'completed'}), 200)
+        return (jsonify({'error': 'Could not complete session'}), 400)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
+@api_bp.route('/sessions/<session_id>/cancel', methods=['POST'])
+@jwt_required()
+def cancel_session(session_id):
+    """Cancel a session"""
+    try:
+        from app.services.session_status_service import session_status_service
+        current_user_id = get_jwt_identity()
+        current_user = User.query.get(current_user_id)
+        if not current_user:
+            return (jsonify({'error': 'User not found'}), 404)
+        session = Session.query.get(session_id)
+        if not session:
+            return (jsonify({'error': 'Session not found'}), 404)
+        if current_user.account_type not in ('tutor', 'admin') and session.tutor_id != current_user_id:
+            return (jsonify({'error': 'Unauthorized'}), 403)
+        data = request.get_json() or {}
+        reason = data.get('reason')
+        success = session_status_service.cancel_session(session_id, reason)
+        if success:
+            return (jsonify({'message': 'Session cancelled successfully', 'session_id': session_id, 'status': 'cancelled'}), 200)
+        return (jsonify({'error': 'Could not cancel session'}), 400)
+    except Exception as e:
+        return (jsonify({'error': str(e)}), 500)
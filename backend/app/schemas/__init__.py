@@ -0,0 +1,6 @@
+"""
+API Response Schemas using Pydantic for standardization
+"""
+from .availability_schemas import *
+from .session_schemas import *
+from .base_schemas import *
@@ -0,0 +1,2 @@
+from .zoom_service import zoom_service
+__all__ = ['zoom_service']
@@ -0,0 +1,108 @@
+"""
+Admin Notification Service
+Handles email notifications to administrators for session analysis issues
+"""
+import os
+import logging
+import smtplib
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from datetime import datetime
+from typing import Dict, Optional
+from app.models import Session, User, Course
+from app import db
+logger = logging.getLogger(__name__)
+class AdminNotificationService:
+    """Service for sending admin notifications about session analysis issues"""
+    def __init__(self):
+        self.sender_email = os.environ.get('SENDER_EMAIL', 'internal@troupe.academy')
+        self.sender_password = os.environ.get('SENDER_PASSWORD', '')
+        self.sender_name = os.environ.get('SENDER_NAME', 'Troupe Academy')
+        self.smtp_server = os.environ.get('SMTP_SERVER', 'smtp.mail.eu-west-1.awsapps.com')
+        self.smtp_port = int(os.environ.get('SMTP_PORT', 465))
+        self.smtp_use_ssl = (os.environ.get('SMTP_USE_SSL', 'true')).lower() == 'true'
+        self.email_configured = bool(self.sender_email and self.sender_password)
+        if not self.email_configured:
+            logger.warning('Email notifications not configured - admin notifications will be logged only')
+            return
+    def get_admin_emails(self) -> list:
+        """Get list of admin email addresses"""
+        try:
+            admins = (User.query.filter_by(account_type='admin', is_active=True)).all()
+            return [admin.email for admin in admins if admin.email]
+        except Exception as e:
+            logger.error(f'Error fetching admin emails: {str(e)}')
+            return []
+    def get_session_details(self, session: Session) -> Dict:
+        """Get detailed session information for notifications"""
+        try:
+            course = Course.query.get(session.course_id) if session.course_id else None
+            tutor = User.query.get(session.tutor_id) if session.tutor_id else None
+            students = session.students if hasattr(session, 'students') else []
+            student_names = [s.profile.get('name', s.email) if s.profile else s.email for s in students]
+            return {'session_id': session.id, 'meeting_id': session.meeting_id, 'meeting_uuid': session.meeting_uuid, 'title': session.title, 'scheduled_date': session.scheduled_date, 'duration': session.duration, 'course_title': course.title if course else 'Unknown Course', 'tutor_name': tutor.profile.get('name', tutor.email) if tutor and tutor.profile else tutor.email if tutor else 'Unknown Tutor', 'student_names': student_names, 'status': session.status}
+        except Exception as e:
+            logger.error(f'Error getting session details: {str(e)}')
+            return {'session_id': session.id, 'meeting_id': session.meeting_id or 'Unknown', 'meeting_uuid': session.meeting_uuid or 'Unknown', 'title': session.title or 'Unknown Session', 'scheduled_date': session.scheduled_date, 'error': f'Could not fetch full details: {str(e)}'}
+    def send_email_notification(self, subject: str, body: str, is_html: bool = False) -> bool:
+        """Send email notification to all admins"""
+        if not self.email_configured:
+            logger.info(f'Email not configured - logging notification:\nSubject: {subject}\nBody: {body}')
+            return False
+        admin_emails = self.get_admin_emails()
+        if not admin_emails:
+            logger.warning('No admin email addresses found')
+            return False
+        try:
+            msg = MIMEMultipart('alternative')
+            msg['From'] = f'{self.sender_name} <{self.sender_email}>'
+            msg['To'] = ', '.join(admin_emails)
+            msg['Subject'] = subject
+            if is_html:
+                msg.attach(MIMEText(body, 'html'))
+            else:
+                msg.attach(MIMEText(body, 'plain'))
+            if self.smtp_use_ssl:
+                server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
+            else:
+                server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+                server.starttls()
+            server.login(self.sender_email, self.sender_password)
+            server.send_message(msg)
+            server.quit()
+            logger.info(f'Admin notification sent to {len(admin_emails)} admins: {subject}')
+            return True
+        except Exception as e:
+            logger.error(f'Failed to send admin notification: {str(e)}')
+            return False
+    def notify_no_recordings_available(self, session: Session) -> None:
+        """Notify admin when no recordings are available for a session"""
+        details = self.get_session_details(session)
+        subject = f"No Recordings Available - Session {details['meeting_id']}"
+        body = f"\nTROUPE ACADEMY - SESSION RECORDING ALERT\n\nNo recordings were generated for the following session:\n\nSESSION DETAILS:\n- Meeting ID: {details['meeting_id']}\n- Meeting UUID: {details['meeting_uuid']}\n- Session Title: {details['title']}\n- Scheduled Date: {details['scheduled_date'].strftime('%Y-%m-%d %H:%M:%S UTC')}\n- Course: {details.get('course_title', 'Unknown')}\n- Tutor: {details.get('tutor_name', 'Unknown')}\n- Students: {', '.join(details.get('student_names', [])) if details.get('student_names') else 'None'}\n\nISSUE:\nNo recording.completed webhook was received from Zoom for this session. This could indicate:\n- Recording was not enabled during the meeting\n- Technical issue with Zoom recording service\n- Meeting was very short or had no participants\n\nACTION:\n- Session status remains as 'completed'\n- No AI analysis will be performed for this session\n- Consider checking Zoom settings for future sessions\n\nThis is an automated notification from the Troupe Academy system.\n        ".strip()
+        self.send_email_notification(subject, body)
+    def notify_recordings_not_enabled(self, session: Session) -> None:
+        """Notify admin when recordings/transcripts weren't enabled during meeting creation"""
+        details = self.get_session_details(session)
+        subject = f"Recording Not Enabled - Session {details['meeting_id']}"
+        body = f"\nTROUPE ACADEMY - SESSION RECORDING CONFIGURATION ALERT\n\nRecording and transcript features were not enabled for the following session:\n\nSESSION DETAILS:\n- Meeting ID: {details['meeting_id']}\n- Meeting UUID: {details['meeting_uuid']}\n- Session Title: {details['title']}\n- Scheduled Date: {details['scheduled_date'].strftime('%Y-%m-%d %H:%M:%S UTC')}\n- Course: {details.get('course_title', 'Unknown')}\n- Tutor: {details.get('tutor_name', 'Unknown')}\n- Students: {', '.join(details.get('student_names', [])) if details.get('student_names') else 'None'}\n\nISSUE:\nThe Zoom meeting was created without recording and transcript features enabled.\n\nRECOMMENDATION:\n- Verify Zoom API configuration includes auto-recording settings\n- Check that future meetings are created with recording enabled by default\n- Review session creation process to ensure proper Zoom settings\n\nACTION:\n- Session status remains as 'completed'\n- No AI analysis will be performed for this session\n\nThis is an automated notification from the Troupe Academy system.\n        ".strip()
+        self.send_email_notification(subject, body)
+    def notify_transcript_download_failed(self, session: Session, error_details: str, download_url: str = None) -> None:
+        """Notify admin when transcript download fails"""
+        details = self.get_session_details(session)
+        subject = f"Transcript Download Failed - Session {details['meeting_id']}"
+        body = f"\nTROUPE ACADEMY - TRANSCRIPT PROCESSING ALERT\n\nFailed to download transcript for the following session:\n\nSESSION DETAILS:\n- Meeting ID: {details['meeting_id']}\n- Meeting UUID: {details['meeting_uuid']}\n- Session Title: {details['title']}\n- Scheduled Date: {details['scheduled_date'].strftime('%Y-%m-%d %H:%M:%S UTC')}\n- Course: {details.get('course_title', 'Unknown')}\n- Tutor: {details.get('tutor_name', 'Unknown')}\n- Students: {', '.join(details.get('student_names', [])) if details.get('student_names') else 'None'}\n\nERROR DETAILS:\n{error_details}\n\nDOWNLOAD URL:\n{download_url if download_url else 'Not available'}\n\nISSUE TYPE: Transcript processing failed\n- Transcript was available but download/processing failed\n- Session status may remain as 'ready_for_analysis'\n\nACTION REQUIRED:\n- Check Zoom API credentials and permissions\n- Verify network connectivity to Zoom servers\n- Consider manual transcript download if needed\n- Review error logs for additional details\n\nThis is an automated notification from the Troupe Academy system.\n        ".strip()
+        self.send_email_notification(subject, body)
+    def notify_ai_analysis_failed(self, session: Session, error_details: str) -> None:
+        """Notify admin when AI analysis fails"""
+        details = self.get_session_details(session)
+        subject = f"AI Analysis Failed - Session {details['meeting_id']}"
+        body = f"\nTROUPE ACADEMY - AI ANALYSIS ALERT\n\nAI analysis failed for the following session:\n\nSESSION DETAILS:\n- Meeting ID: {details['meeting_id']}\n- Meeting UUID: {details['meeting_uuid']}\n- Session Title: {details['title']}\n- Scheduled Date: {details['scheduled_date'].strftime('%Y-%m-%d %H:%M:%S UTC')}\n- Course: {details.get('course_title', 'Unknown')}\n- Tutor: {details.get('tutor_name', 'Unknown')}\n- Students: {', '.join(details.get('student_names', [])) if details.get('student_names') else 'None'}\n\nERROR DETAILS:\n{error_details}\n\nISSUE TYPE: AI analysis processing failed\n- Transcript was available but AI processing failed\n- Session status remains as 'ready_for_analysis'\n\nACTION REQUIRED:\n- Check OpenAI API configuration and credits\n- Verify AI service availability\n- Review transcript quality and format\n- Consider manual analysis if needed\n\nThis is an automated notification from the Troupe Academy system.\n        ".strip()
+        self.send_email_notification(subject, body)
+    def notify_no_transcript_available(self, session: Session, reason: str = 'Unknown') -> None:
+        """Notify admin when no transcript is available from Zoom"""
+        details = self.get_session_details(session)
+        subject = f"No Transcript Available - Session {details['meeting_id']}"
+        body = f"\nTROUPE ACADEMY - TRANSCRIPT AVAILABILITY ALERT\n\nNo transcript was generated for the following session:\n\nSESSION DETAILS:\n- Meeting ID: {details['meeting_id']}\n- Meeting UUID: {details['meeting_uuid']}\n- Session Title: {details['title']}\n- Scheduled Date: {details['scheduled_date'].strftime('%Y-%m-%d %H:%M:%S UTC')}\n- Course: {details.get('course_title', 'Unknown')}\n- Tutor: {details.get('tutor_name', 'Unknown')}\n- Students: {', '.join(details.get('student_names', [])) if details.get('student_names') else 'None'}\n\nREASON:\n{reason}\n\nISSUE TYPE: No transcript was generated by Zoom\nThis could be due to:\n- Transcript feature disabled in Zoom settings\n- Poor audio quality preventing transcription\n- Meeting duration too short for transcription\n- No speech detected during the session\n\nACTION:\n- Session status remains as 'completed'\n- No AI analysis will be performed\n- Consider reviewing Zoom transcription settings\n\nThis is an automated notification from the Troupe Academy system.\n        ".strip()
+        self.send_email_notification(subject, body)
+admin_notification_service = AdminNotificationService()
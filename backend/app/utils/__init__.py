@@ -0,0 +1,5 @@
+"""
+Utility modules for the application
+"""
+from .weekday_utils import js_to_python_weekday, python_to_js_weekday, validate_and_convert_weekday_input, get_weekday_names, convert_js_weekdays_to_python, convert_python_weekdays_to_js
+__all__ = ['js_to_python_weekday', 'python_to_js_weekday', 'validate_and_convert_weekday_input', 'get_weekday_names', 'convert_js_weekdays_to_python', 'convert_python_weekdays_to_js']
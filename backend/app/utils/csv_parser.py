@@ -0,0 +1,293 @@
+"""
+CSV Parser Utility for Bulk Import System
+Handles parsing and validation of CSV data for tutor qualifications
+"""
+import csv
+import io
+import itertools
+from typing import List, Dict, Any, Tuple, Optional
+from datetime import datetime
+import re
+class CSVParseError(Exception):
+    """Custom exception for CSV parsing errors"""
+class CSVParser:
+    """
+    CSV Parser for tutor qualification bulk imports
+    Expected CSV format: email,course_id,score,qualification_date
+    """
+    REQUIRED_COLUMNS = ['email', 'course_id', 'score', 'qualification_date']
+    EMAIL_REGEX = re.compile('^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$')
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+    def parse_csv_text(self, csv_text: str, auto_add_headers: bool = False) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Parse CSV text and return validated records and errors
+
+        Args:
+            csv_text (str): Raw CSV text content
+            auto_add_headers (bool): If True, automatically add headers if missing
+
+        Returns:
+            Tuple[List[Dict], List[str]]: (valid_records, errors)
+        """
+        self.errors = []
+        self.warnings = []
+        if not csv_text.strip():
+            raise CSVParseError('CSV data is empty')
+        try:
+            processed_csv_text = csv_text.strip()
+            if auto_add_headers:
+                processed_csv_text = self._maybe_add_headers(processed_csv_text)
+            csv_reader = csv.DictReader(io.StringIO(processed_csv_text))
+            if not self._validate_headers(csv_reader.fieldnames):
+                raise CSVParseError(f"Invalid CSV headers. Required: {', '.join(self.REQUIRED_COLUMNS)}")
+            valid_records = []
+            row_number = 1
+            for row in csv_reader:
+                row_number += 1
+                validated_row, row_errors = self._validate_row(row, row_number)
+                if row_errors:
+                    self.errors.extend(row_errors)
+                else:
+                    valid_records.append(validated_row)
+            return (valid_records, self.errors)
+        except csv.Error as e:
+            raise CSVParseError(f'CSV parsing error: {str(e)}')
+        except Exception as e:
+            raise CSVParseError(f'Unexpected error parsing CSV: {str(e)}')
+    def parse_csv_file(self, file, auto_add_headers: bool = False) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Parse CSV file and return validated records and errors
+
+        Args:
+            file: File object from request
+            auto_add_headers (bool): If True, automatically add headers if missing
+
+        Returns:
+            Tuple[List[Dict], List[str]]: (valid_records, errors)
+        """
+        try:
+            file.seek(0)
+            content = file.read()
+            if isinstance(content, bytes):
+                content = content.decode('utf-8-sig')
+            return self.parse_csv_text(content, auto_add_headers)
+        except UnicodeDecodeError:
+            raise CSVParseError('File encoding error. Please use UTF-8 encoding.')
+        except Exception as e:
+            raise CSVParseError(f'Error reading file: {str(e)}')
+    def parse_csv_stream(self, stream, auto_add_headers: bool = False) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Parse a CSV byte stream incrementally and return validated records and errors
+
+        Reads rows straight off the stream instead of materializing the whole
+        file in memory first.
+
+        Args:
+            stream: Binary file-like object positioned at the start of the CSV
+            auto_add_headers (bool): If True, automatically add headers if missing
+
+        Returns:
+            Tuple[List[Dict], List[str]]: (valid_records, errors)
+        """
+        self.errors = []
+        self.warnings = []
+        try:
+            wrapper = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+            first_line = wrapper.readline()
+            while first_line and not first_line.strip():
+                first_line = wrapper.readline()
+            if not first_line:
+                raise CSVParseError('CSV data is empty')
+            lines = itertools.chain([first_line], wrapper)
+            if auto_add_headers and self._line_needs_headers(first_line.strip()):
+                csv_reader = csv.DictReader(lines, fieldnames=self.REQUIRED_COLUMNS)
+            else:
+                csv_reader = csv.DictReader(lines)
+            if not self._validate_headers(csv_reader.fieldnames):
+                raise CSVParseError(f"Invalid CSV headers. Required: {', '.join(self.REQUIRED_COLUMNS)}")
+            valid_records = []
+            row_number = 1
+            for row in csv_reader:
+                row_number += 1
+                validated_row, row_errors = self._validate_row(row, row_number)
+                if row_errors:
+                    self.errors.extend(row_errors)
+                else:
+                    valid_records.append(validated_row)
+            return (valid_records, self.errors)
+        except UnicodeDecodeError:
+            raise CSVParseError('File encoding error. Please use UTF-8 encoding.')
+        except csv.Error as e:
+            raise CSVParseError(f'CSV parsing error: {str(e)}')
+    def _validate_headers(self, headers: Optional[List[str]]) -> bool:
+        """
+        Validate that all required headers are present
+
+        Args:
+            headers: List of CSV headers
+
+        Returns:
+            bool: True if all required headers are present
+        """
+        if not headers:
+            return False
+        normalized_headers = [(h.strip()).lower() if h else '' for h in headers]
+        required_normalized = [h.lower() for h in self.REQUIRED_COLUMNS]
+        missing_headers = [h for h in required_normalized if h not in normalized_headers]
+        if missing_headers:
+            self.errors.append(f"Missing required columns: {', '.join(missing_headers)}")
+            return False
+        return True
+    def _maybe_add_headers(self, csv_text: str) -> str:
+        """
+        Check if CSV text has headers and add them if missing
+
+        Args:
+            csv_text (str): Raw CSV text
+
+        Returns:
+            str: CSV text with headers (added if necessary)
+        """
+        lines = (csv_text.strip()).split('\n')
+        if not lines:
+            return csv_text
+        if self._line_needs_headers(lines[0].strip()):
+            headers = ','.join(self.REQUIRED_COLUMNS)
+            return headers + '\n' + csv_text
+        return csv_text
+    def _line_needs_headers(self, first_line: str) -> bool:
+        """
+        Check whether a first CSV line looks like data rather than headers
+
+        Args:
+            first_line (str): First non-empty line of the CSV
+
+        Returns:
+            bool: True if the required headers should be prepended
+        """
+        first_line_lower = first_line.lower()
+        has_email = 'email' in first_line_lower
+        has_course_id = 'course_id' in first_line_lower or 'course' in first_line_lower
+        has_score = 'score' in first_line_lower
+        has_date = 'date' in first_line_lower
+        if has_email and has_course_id or has_email and has_score and has_date:
+            return False
+        if '@' in first_line and ',' in first_line:
+            parts = first_line.split(',')
+            if len(parts) >= 3:
+                return True
+        return False
+    def _validate_row(self, row: Dict[str, str], row_number: int) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """
+        Validate and clean a single CSV row
+
+        Args:
+            row: Dictionary containing row data
+            row_number: Row number for error reporting
+
+        Returns:
+            Tuple[Optional[Dict], List[str]]: (validated_row, errors)
+        """
+        errors = []
+        validated_row = {}
+        normalized_row = {(k.strip()).lower(): v.strip() if v else '' for k, v in row.items()}
+        email = (normalized_row.get('email', '')).lower()
+        if not email:
+            errors.append(f'Row {row_number}: Email is required')
+        else:
+            if not self.EMAIL_REGEX.match(email):
+                errors.append(f'Row {row_number}: Invalid email format: {email}')
+            else:
+                validated_row['email'] = email
+        course_id = (normalized_row.get('course_id', '')).strip()
+        if not course_id:
+            errors.append(f'Row {row_number}: Course ID is required')
+        else:
+            validated_row['course_id'] = course_id
+        score_str = (normalized_row.get('score', '')).strip()
+        if not score_str:
+            errors.append(f'Row {row_number}: Score is required')
+        else:
+            try:
+                score = float(score_str)
+                if score < 0 or score > 100:
+                    errors.append(f'Row {row_number}: Score must be between 0 and 100, got {score}')
+                else:
+                    validated_row['score'] = score
+            except ValueError:
+                errors.append(f'Row {row_number}: Invalid score format: {score_str}')
+        date_str = (normalized_row.get('qualification_date', '')).strip()
+        if not date_str:
+            errors.append(f'Row {row_number}: Qualification date is required')
+        else:
+            try:
+                date_formats = ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S']
+                parsed_date = None
+                for date_format in date_formats:
+                    try:
+                        parsed_date = datetime.strptime(date_str, date_format)
+                    except ValueError:
+                        continue
+                    break
+                if parsed_date is None:
+                    errors.append(f'Row {row_number}: Invalid date format: {date_str}. Use YYYY-MM-DD or MM/DD/YYYY')
+                else:
+                    if parsed_date > datetime.now():
+                        self.warnings.append(f'Row {row_number}: Future qualification date: {date_str}')
+                    validated_row['qualification_date'] = parsed_date
+            except Exception as e:
+                errors.append(f'Row {row_number}: Date parsing error: {str(e)}')
+        if len([k for k, v in normalized_row.items() if v.strip()]) == 0:
+            errors.append(f'Row {row_number}: Empty row')
+        if not errors:
+            return (validated_row, errors)
+        return (None, errors)
+    def validate_batch_constraints(self, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Validate constraints across the entire batch
+
+        Args:
+            records: List of validated records
+
+        Returns:
+            List[str]: List of batch-level errors
+        """
+        batch_errors = []
+        seen_combinations = set()
+        for i, record in enumerate(records, 1):
+            combination = (record['email'], record['course_id'])
+            if combination in seen_combinations:
+                batch_errors.append(f"Duplicate email-course combination found: {record['email']} - {record['course_id']}")
+            seen_combinations.add(combination)
+        if len(records) > 1000:
+            batch_errors.append(f'Batch too large: {len(records)} records. Maximum allowed: 1000')
+        if len(records) == 0:
+            batch_errors.append('No valid records found in CSV')
+        return batch_errors
+    def generate_sample_csv(self) -> str:
+        """
+        Generate a sample CSV for user reference
+
+        Returns:
+            str: Sample CSV content
+        """
+        sample_data = [['email', 'course_id', 'score', 'qualification_date'], ['student1@example.com', 'math-101', '92.5', '2024-01-15'], ['student2@example.com', 'physics-201', '88.0', '2024-01-10'], ['student3@example.com', 'math-101', '95.5', '2024-01-12']]
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerows(sample_data)
+        return output.getvalue()
+    def get_validation_summary(self, total_rows: int, valid_records: int, errors: List[str]) -> Dict[str, Any]:
+        """
+        Generate a summary of validation results
+
+        Args:
+            total_rows: Total number of rows processed
+            valid_records: Number of valid records
+            errors: List of validation errors
+
+        Returns:
+            Dict: Validation summary
+        """
+        return {'total_rows': total_rows, 'valid_records': valid_records, 'invalid_records': total_rows - valid_records, 'error_count': len(errors), 'warning_count': len(self.warnings), 'errors': errors, 'warnings': self.warnings, 'success_rate': round(valid_records / total_rows * 100 if total_rows > 0 else 0, 2)}
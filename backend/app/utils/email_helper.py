@@ -0,0 +1,150 @@
+import smtplib
+import ssl
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from email.mime.base import MIMEBase
+from email import encoders
+import os
+from typing import Optional, List
+import logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+class EmailConfig:
+    """Email configuration class"""
+    def __init__(self):
+        self.smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
+        self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
+        self.sender_email = os.getenv('SENDER_EMAIL')
+        self.sender_password = os.getenv('SENDER_PASSWORD')
+        self.smtp_username = os.getenv('SMTP_USERNAME')
+        self.sender_name = os.getenv('SENDER_NAME', 'Tutor Academy')
+        self.use_ssl = (os.getenv('SMTP_USE_SSL', 'false')).lower() == 'true'
+        self.auth_username = self.smtp_username if self.smtp_username else self.sender_email
+        if not self.sender_email or not self.sender_password:
+            raise ValueError('SENDER_EMAIL and SENDER_PASSWORD environment variables must be set')
+def send_email(recipient_email: str, subject: str, text_content: str,
+        html_content: Optional[str] = None,
+        attachments: Optional[List[str]] = None,
+        cc_emails: Optional[List[str]] = None,
+        bcc_emails: Optional[List[str]] = None) -> bool:
+    """
+    Send an email with optional HTML content and attachments
+    
+    Args:
+        recipient_email (str): Recipient's email address
+        subject (str): Email subject
+        text_content (str): Plain text content
+        html_content (str, optional): HTML content for rich emails
+        attachments (List[str], optional): List of file paths to attach
+        cc_emails (List[str], optional): List of CC email addresses
+        bcc_emails (List[str], optional): List of BCC email addresses
+    
+    Returns:
+        bool: True if email sent successfully, False otherwise
+    """
+    try:
+        config = EmailConfig()
+        message = MIMEMultipart('alternative')
+        message['Subject'] = subject
+        message['From'] = f'{config.sender_name} <{config.sender_email}>'
+        message['To'] = recipient_email
+        if cc_emails:
+            message['Cc'] = ', '.join(cc_emails)
+        if bcc_emails:
+            message['Bcc'] = ', '.join(bcc_emails)
+        text_part = MIMEText(text_content, 'plain')
+        message.attach(text_part)
+        if html_content:
+            html_part = MIMEText(html_content, 'html')
+            message.attach(html_part)
+        if attachments:
+            for file_path in attachments:
+                if os.path.isfile(file_path):
+                    with open(file_path, 'rb') as attachment:
+                        part = MIMEBase('application', 'octet-stream')
+                        part.set_payload(attachment.read())
+                    encoders.encode_base64(part)
+                    part.add_header('Content-Disposition', f'attachment; filename= {os.path.basename(file_path)}')
+                    message.attach(part)
+                else:
+                    logger.warning(f'Attachment file not found: {file_path}')
+        all_recipients = [recipient_email]
+        if cc_emails:
+            all_recipients.extend(cc_emails)
+        if bcc_emails:
+            all_recipients.extend(bcc_emails)
+        context = ssl.create_default_context()
+        if config.use_ssl:
+            with smtplib.SMTP_SSL(config.smtp_server, config.smtp_port, context=context) as server:
+                server.login(config.auth_username, config.sender_password)
+                server.sendmail(config.sender_email, all_recipients, message.as_string())
+        else:
+            with smtplib.SMTP(config.smtp_server, config.smtp_port) as server:
+                server.starttls(context=context)
+                server.login(config.auth_username, config.sender_password)
+                server.sendmail(config.sender_email, all_recipients, message.as_string())
+        logger.info(f'Email sent successfully to {recipient_email}')
+        return True
+    except Exception as e:
+        logger.error(f'Failed to send email to {recipient_email}: {str(e)}')
+        return False
+def send_simple_email(recipient_email: str, subject: str, text_content: str) -> bool:
+    """
+    Simplified email sending function for basic text emails
+    
+    Args:
+        recipient_email (str): Recipient's email address
+        subject (str): Email subject
+        text_content (str): Plain text content
+    
+    Returns:
+        bool: True if email sent successfully, False otherwise
+    """
+    return send_email(recipient_email, subject, text_content)
+def send_welcome_email(recipient_email: str, user_name: str) -> bool:
+    """
+    Send a welcome email to new users
+    
+    Args:
+        recipient_email (str): New user's email address
+        user_name (str): New user's name
+    
+    Returns:
+        bool: True if email sent successfully, False otherwise
+    """
+    subject = 'Welcome to Tutor Academy!'
+    text_content = f'\n    Hi {user_name},\n\n    Welcome to Tutor Academy! We\'re excited to have you join our learning community.\n\n    Your account has been successfully created. You can now:\n    - Browse available courses\n    - Schedule tutoring sessions\n    - Connect with qualified tutors\n    - Track your learning progress\n\n    If you have any questions, feel free to reach out to our support team.\n\n    Best regards,\n    The Tutor Academy Team\n    '
+    html_content = f'\n    <html>\n    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">\n        <div style="max-width: 600px; margin: 0 auto; padding: 20px;">\n            <h2 style="color: #4338ca;">Welcome to Tutor Academy!</h2>\n            \n            <p>Hi <strong>{user_name}</strong>,</p>\n            \n            <p>Welcome to Tutor Academy! We\'re excited to have you join our learning community.</p>\n            \n            <p>Your account has been successfully created. You can now:</p>\n            <ul>\n                <li>Browse available courses</li>\n                <li>Schedule tutoring sessions</li>\n                <li>Connect with qualified tutors</li>\n                <li>Track your learning progress</li>\n            </ul>\n            \n            <p>If you have any questions, feel free to reach out to our support team.</p>\n            \n            <p>Best regards,<br>\n            <strong>The Tutor Academy Team</strong></p>\n            \n            <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">\n            <p style="font-size: 12px; color: #666;">\n                This email was sent from Tutor Academy. If you did not create an account, please ignore this email.\n            </p>\n        </div>\n    </body>\n    </html>\n    '
+    return send_email(recipient_email, subject, text_content, html_content)
+def send_session_reminder(recipient_email: str, user_name: str, session_details: dict) -> bool:
+    """
+    Send a session reminder email
+    
+    Args:
+        recipient_email (str): Recipient's email address
+        user_name (str): User's name
+        session_details (dict): Dictionary containing session information
+    
+    Returns:
+        bool: True if email sent successfully, False otherwise
+    """
+    subject = f"Session Reminder: {session_details.get('title', 'Upcoming Session')}"
+    text_content = f"\n    Hi {user_name},\n\n    This is a reminder about your upcoming tutoring session:\n\n    Session: {session_details.get('title', 'N/A')}\n    Date: {session_details.get('date', 'N/A')}\n    Time: {session_details.get('time', 'N/A')}\n    Duration: {session_details.get('duration', 'N/A')} minutes\n    Tutor: {session_details.get('tutor_name', 'N/A')}\n\n    Meeting Details:\n    Meeting ID: {session_details.get('meeting_id', 'N/A')}\n    Meeting Link: {session_details.get('meeting_link', 'N/A')}\n    Password: {session_details.get('meeting_password', 'N/A')}\n\n    Please join the session 5 minutes before the scheduled time.\n\n    Best regards,\n    The Tutor Academy Team\n    "
+    html_content = f"\n    <html>\n    <body style=\"font-family: Arial, sans-serif; line-height: 1.6; color: #333;\">\n        <div style=\"max-width: 600px; margin: 0 auto; padding: 20px;\">\n            <h2 style=\"color: #4338ca;\">Session Reminder</h2>\n            \n            <p>Hi <strong>{user_name}</strong>,</p>\n            \n            <p>This is a reminder about your upcoming tutoring session:</p>\n            \n            <div style=\"background: #f8f9fa; padding: 15px; border-radius: 8px; margin: 20px 0;\">\n                <h3 style=\"margin-top: 0; color: #2c5aa0;\">{session_details.get('title', 'N/A')}</h3>\n                <p><strong>Date:</strong> {session_details.get('date', 'N/A')}</p>\n                <p><strong>Time:</strong> {session_details.get('time', 'N/A')}</p>\n                <p><strong>Duration:</strong> {session_details.get('duration', 'N/A')} minutes</p>\n                <p><strong>Tutor:</strong> {session_details.get('tutor_name', 'N/A')}</p>\n            </div>\n            \n            <div style=\"background: #e3f2fd; padding: 15px; border-radius: 8px; margin: 20px 0;\">\n                <h4 style=\"margin-top: 0; color: #1565c0;\">Meeting Details</h4>\n                <p><strong>Meeting ID:</strong> {session_details.get('meeting_id', 'N/A')}</p>\n                <p><strong>Meeting Link:</strong> <a href=\"{session_details.get('meeting_link', '#')}\" style=\"color: #1565c0;\">{session_details.get('meeting_link', 'N/A')}</a></p>\n                <p><strong>Password:</strong> {session_details.get('meeting_password', 'N/A')}</p>\n            </div>\n            \n            <p><strong>Please join the session 5 minutes before the scheduled time.</strong></p>\n            \n            <p>Best regards,<br>\n            <strong>The Tutor Academy Team</strong></p>\n        </div>\n    </body>\n    </html>\n    "
+    return send_email(recipient_email, subject, text_content, html_content)
+def get_email_template(template_name: str, **kwargs) -> tuple:
+    """
+    Get email templates for common use cases
+    
+    Args:
+        template_name (str): Name of the template
+        **kwargs: Template variables
+    
+    Returns:
+        tuple: (subject, text_content, html_content)
+    """
+    templates = {'password_reset': {'subject': 'Password Reset Request', 'text': f"\n            Hi {kwargs.get('user_name', 'User')},\n\n            You requested a password reset for your Tutor Academy account.\n\n            Please click the following link to reset your password:\n            {kwargs.get('reset_link', 'N/A')}\n\n            This link will expire in 1 hour.\n\n            If you did not request this password reset, please ignore this email.\n\n            Best regards,\n            The Tutor Academy Team\n            ", 'html': f"\n            <html>\n            <body style=\"font-family: Arial, sans-serif; line-height: 1.6; color: #333;\">\n                <div style=\"max-width: 600px; margin: 0 auto; padding: 20px;\">\n                    <h2 style=\"color: #4338ca;\">Password Reset Request</h2>\n                    \n                    <p>Hi <strong>{kwargs.get('user_name', 'User')}</strong>,</p>\n                    \n                    <p>You requested a password reset for your Tutor Academy account.</p>\n                    \n                    <div style=\"text-align: center; margin: 30px 0;\">\n                        <a href=\"{kwargs.get('reset_link', '#')}\" \n                           style=\"background: #4338ca; color: white; padding: 12px 24px; \n                                  text-decoration: none; border-radius: 6px; display: inline-block;\">\n                            Reset Password\n                        </a>\n                    </div>\n                    \n                    <p style=\"color: #666; font-size: 14px;\">\n                        This link will expire in 1 hour. If you did not request this password reset, please ignore this email.\n                    </p>\n                    \n                    <p>Best regards,<br>\n                    <strong>The Tutor Academy Team</strong></p>\n                </div>\n            </body>\n            </html>\n            "}, 'admin_password_reset': {'subject': 'Your password has been reset by an administrator', 'text': f"\n            Hi {kwargs.get('user_name', 'User')},\n\n            An administrator ({kwargs.get('admin_name', 'Administrator')}) has initiated a password reset for your Tutor Academy account.\n\n            Please click the following link to reset your password:\n            {kwargs.get('reset_link', 'N/A')}\n\n            This link will expire in {kwargs.get('expiry_time', '1 hour')}.\n\n            If you did not request this password reset, please contact support immediately.\n\n            Best regards,\n            The Tutor Academy Team\n            ", 'html': f"\n            <html>\n            <body style=\"font-family: Arial, sans-serif; line-height: 1.6; color: #333;\">\n                <div style=\"max-width: 600px; margin: 0 auto; padding: 20px;\">\n                    <div style=\"background: #fff3cd; border: 1px solid #ffeaa7; padding: 15px; border-radius: 6px; margin-bottom: 20px;\">\n                        <h2 style=\"color: #856404; margin: 0;\">⚠️ Password Reset by Administrator</h2>\n                    </div>\n                    \n                    <p>Hi <strong>{kwargs.get('user_name', 'User')}</strong>,</p>\n                    \n                    <p>An administrator (<strong>{kwargs.get('admin_name', 'Administrator')}</strong>) has initiated a password reset for your Tutor Academy account.</p>\n                    \n                    <div style=\"text-align: center; margin: 30px 0;\">\n                        <a href=\"{kwargs.get('reset_link', '#')}\" \n                           style=\"background: #dc3545; color: white; padding: 12px 24px; \n                                  text-decoration: none; border-radius: 6px; display: inline-block;\">\n                            Reset Password\n                        </a>\n                    </div>\n                    \n                    <p style=\"font-size: 14px; color: #666;\">\n                        This link will expire in <strong>{kwargs.get('expiry_time', '1 hour')}</strong>. \n                        If you did not request this password reset, please contact support immediately.\n                    </p>\n                    \n                    <p>Best regards,<br>\n                    <strong>The Tutor Academy Team</strong></p>\n                    \n                    <hr style=\"border: none; border-top: 1px solid #eee; margin: 20px 0;\">\n                    <p style=\"font-size: 12px; color: #666;\">\n                        This action was initiated by an administrator for security purposes. All admin actions are logged and audited.\n                    </p>\n                </div>\n            </body>\n            </html>\n            "}, 'admin_temp_password': {'subject': 'Temporary password created by administrator', 'text': f"\n            Hi {kwargs.get('user_name', 'User')},\n\n            An administrator ({kwargs.get('admin_name', 'Administrator')}) has generated a temporary password for your Tutor Academy account.\n\n            Temporary Password: {kwargs.get('temporary_password', 'N/A')}\n\n            This password will expire in {kwargs.get('expiry_time', '24 hours')}. You will be required to change it upon your next login.\n\n            Please log in and change your password as soon as possible.\n\n            Best regards,\n            The Tutor Academy Team\n            ", 'html': f"\n            <html>\n            <body style=\"font-family: Arial, sans-serif; line-height: 1.6; color: #333;\">\n                <div style=\"max-width: 600px; margin: 0 auto; padding: 20px;\">\n                    <div style=\"background: #fff3cd; border: 1px solid #ffeaa7; padding: 15px; border-radius: 6px; margin-bottom: 20px;\">\n                        <h2 style=\"color: #856404; margin: 0;\">🔑 Temporary Password Generated</h2>\n                    </div>\n                    \n                    <p>Hi <strong>{kwargs.get('user_name', 'User')}</strong>,</p>\n                    \n                    <p>An administrator (<strong>{kwargs.get('admin_name', 'Administrator')}</strong>) has generated a temporary password for your Tutor Academy account.</p>\n                    \n                    <div style=\"background: #f8f9fa; padding: 20px; border-radius: 6px; text-align: center; margin: 20px 0; border: 2px solid #dee2e6;\">\n                        <p style=\"margin: 0 0 10px 0;\"><strong>Temporary Password:</strong></p>\n                        <code style=\"font-size: 18px; background: #fff; padding: 10px 15px; border-radius: 4px; display: inline-block; border: 1px solid #ccc; letter-spacing: 1px;\">{kwargs.get('temporary_password', 'N/A')}</code>\n                    </div>\n                    \n                    <div style=\"background: #f8d7da; border: 1px solid #f5c6cb; padding: 15px; border-radius: 6px; margin: 20px 0;\">\n                        <p style=\"margin: 0; color: #721c24;\"><strong>⚠️ Important:</strong></p>\n                        <ul style=\"margin: 10px 0 0 20px; color: #721c24;\">\n                            <li>This password will expire in <strong>{kwargs.get('expiry_time', '24 hours')}</strong></li>\n                            <li>You will be required to change it upon your next login</li>\n                            <li>Keep this password secure and do not share it</li>\n                        </ul>\n                    </div>\n                    \n                    <p><strong>Please log in and change your password as soon as possible.</strong></p>\n                    \n                    <p>Best regards,<br>\n                    <strong>The Tutor Academy Team</strong></p>\n                    \n                    <hr style=\"border: none; border-top: 1px solid #eee; margin: 20px 0;\">\n                    <p style=\"font-size: 12px; color: #666;\">\n                        This temporary password was generated by an administrator. All admin actions are logged and audited.\n                    </p>\n                </div>\n            </body>\n            </html>\n            "}}
+    if template_name in templates:
+        template = templates[template_name]
+        return (template['subject'], template['text'], template['html'])
+    raise ValueError(f'Template \'{template_name}\' not found')
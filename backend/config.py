@@ -0,0 +1,54 @@
+import os
+from datetime import timedelta
+from dotenv import load_dotenv
+load_dotenv()
+class Config:
+    """Base configuration class"""
+    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
+    DEBUG = False
+    TESTING = False
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or f"sqlite:///{os.path.abspath('instance/orms.db')}"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ECHO = False
+    SQLALCHEMY_ENGINE_OPTIONS = {'pool_pre_ping': True, 'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)), 'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20))} if os.environ.get('DATABASE_URL') else {}
+    JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key-change-in-production'
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=int(os.environ.get('JWT_ACCESS_TOKEN_EXPIRES', 86400)))
+    JWT_REFRESH_TOKEN_EXPIRES = timedelta(seconds=int(os.environ.get('JWT_REFRESH_TOKEN_EXPIRES', 2592000)))
+    JWT_TOKEN_LOCATION = ['headers']
+    JWT_HEADER_NAME = 'Authorization'
+    JWT_HEADER_TYPE = 'Bearer'
+    CORS_ORIGINS = (os.environ.get('CORS_ORIGINS', 'http://localhost:3000')).split(',')
+    UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER', 'uploads')
+    MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 10485760))
+    ALLOWED_EXTENSIONS = set((os.environ.get('ALLOWED_EXTENSIONS', 'pdf,doc,docx,jpg,jpeg,png,mp4,mp3')).split(','))
+    BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
+    ITEMS_PER_PAGE = 20
+    REDIS_URL = os.environ.get('REDIS_URL')
+    RATELIMIT_ENABLED = (os.environ.get('RATELIMIT_ENABLED', 'True')).lower() == 'true'
+    RATELIMIT_DEFAULT = os.environ.get('RATELIMIT_DEFAULT', '100 per hour')
+    TIMEZONE_FIX_ENABLED = (os.environ.get('TIMEZONE_FIX_ENABLED', 'true')).lower() == 'true'
+    ZOOM_AUTO_CREATE_MEETINGS = (os.environ.get('ZOOM_AUTO_CREATE_MEETINGS', 'true')).lower() == 'true'
+    STRIPE_SECRET_KEY = os.environ.get('STRIPE_SECRET_KEY')
+    STRIPE_PUBLISHABLE_KEY = os.environ.get('STRIPE_PUBLISHABLE_KEY')
+    STRIPE_WEBHOOK_SECRET = os.environ.get('STRIPE_WEBHOOK_SECRET')
+    ADMIN_SECRET = os.environ.get('ADMIN_SECRET')
+class DevelopmentConfig(Config):
+    """Development configuration"""
+    DEBUG = True
+    SQLALCHEMY_ECHO = True
+class TestingConfig(Config):
+    """Testing configuration"""
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=5)
+    WTF_CSRF_ENABLED = False
+class ProductionConfig(Config):
+    """Production configuration"""
+    DEBUG = False
+    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
+    SESSION_COOKIE_SECURE = True
+    SESSION_COOKIE_HTTPONLY = True
+    SESSION_COOKIE_SAMESITE = 'Lax'
+    PREFERRED_URL_SCHEME = 'https'
+config = {'development': DevelopmentConfig, 'testing': TestingConfig, 'production': ProductionConfig, 'default': DevelopmentConfig}
@@ -0,0 +1,23 @@
+"""Add index on sessions.availability_id
+
+Revision ID: a4d9c07e51b2
+Revises: f1c2d4a90b3e
+Create Date: 2026-09-01 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+revision = 'a4d9c07e51b2'
+down_revision = 'f1c2d4a90b3e'
+branch_labels = None
+depends_on = None
+def upgrade():
+    try:
+        op.create_index('ix_session_availability_id', 'sessions', ['availability_id'])
+    except Exception:
+        pass
+def downgrade():
+    try:
+        op.drop_index('ix_session_availability_id', table_name='sessions')
+    except Exception:
+        pass
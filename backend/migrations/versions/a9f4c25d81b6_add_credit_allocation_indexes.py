@@ -0,0 +1,39 @@
+"""Add indexes for credit allocation and transaction lookups
+
+Revision ID: a9f4c25d81b6
+Revises: e5f8a13b96c4
+Create Date: 2026-09-01 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+revision = 'a9f4c25d81b6'
+down_revision = 'e5f8a13b96c4'
+branch_labels = None
+depends_on = None
+def upgrade():
+    try:
+        op.create_index('ix_sca_guardian_student', 'student_credit_allocations', ['guardian_id', 'student_id'])
+    except Exception:
+        pass
+    try:
+        op.create_index('ix_sca_student', 'student_credit_allocations', ['student_id'])
+    except Exception:
+        pass
+    try:
+        op.create_index('ix_ct_guardian_created', 'credit_transactions', ['guardian_id', 'created_at'])
+    except Exception:
+        pass
+def downgrade():
+    try:
+        op.drop_index('ix_ct_guardian_created', table_name='credit_transactions')
+    except Exception:
+        pass
+    try:
+        op.drop_index('ix_sca_student', table_name='student_credit_allocations')
+    except Exception:
+        pass
+    try:
+        op.drop_index('ix_sca_guardian_student', table_name='student_credit_allocations')
+    except Exception:
+        pass
@@ -0,0 +1,23 @@
+"""Add BRIN index on credit_transactions.created_at for time-range scans
+
+Revision ID: b2c7e94f30da
+Revises: a9f4c25d81b6
+Create Date: 2026-09-01 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+revision = 'b2c7e94f30da'
+down_revision = 'a9f4c25d81b6'
+branch_labels = None
+depends_on = None
+def upgrade():
+    try:
+        op.create_index('ix_ct_created_brin', 'credit_transactions', ['created_at'], postgresql_using='brin')
+    except Exception:
+        pass
+def downgrade():
+    try:
+        op.drop_index('ix_ct_created_brin', table_name='credit_transactions')
+    except Exception:
+        pass
@@ -0,0 +1,25 @@
+"""Add unique constraint on course_settings.course_id
+
+Revision ID: b7e3f92a64c1
+Revises: a4d9c07e51b2
+Create Date: 2026-09-01 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+revision = 'b7e3f92a64c1'
+down_revision = 'a4d9c07e51b2'
+branch_labels = None
+depends_on = None
+def upgrade():
+    try:
+        with op.batch_alter_table('course_settings') as batch_op:
+            batch_op.create_unique_constraint('uq_course_settings_course_id', ['course_id'])
+    except Exception:
+        pass
+def downgrade():
+    try:
+        with op.batch_alter_table('course_settings') as batch_op:
+            batch_op.drop_constraint('uq_course_settings_course_id', type_='unique')
+    except Exception:
+        pass
@@ -0,0 +1,23 @@
+"""Add composite index for chat message listing
+
+Revision ID: c3d8f1a27e90
+Revises: b7e3f92a64c1
+Create Date: 2026-09-01 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+revision = 'c3d8f1a27e90'
+down_revision = 'b7e3f92a64c1'
+branch_labels = None
+depends_on = None
+def upgrade():
+    try:
+        op.create_index('ix_chat_message_chat_deleted_created', 'chat_messages', ['chat_id', 'is_deleted', 'created_at'])
+    except Exception:
+        pass
+def downgrade():
+    try:
+        op.drop_index('ix_chat_message_chat_deleted_created', table_name='chat_messages')
+    except Exception:
+        pass
@@ -0,0 +1,23 @@
+"""Add country and grade_level to courses table
+
+Revision ID: cb3334738232
+Revises: 
+Create Date: 2025-08-12 18:34:27.027290
+
+"""
+from alembic import op
+import sqlalchemy as sa
+revision = 'cb3334738232'
+down_revision = None
+branch_labels = None
+depends_on = None
+def upgrade():
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('country', sa.String(length=100), nullable=True))
+        batch_op.add_column(sa.Column('grade_level', sa.String(length=50), nullable=True))
+    return
+def downgrade():
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.drop_column('grade_level')
+        batch_op.drop_column('country')
+    return
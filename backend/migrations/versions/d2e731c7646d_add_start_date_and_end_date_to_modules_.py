@@ -0,0 +1,23 @@
+"""Add start_date and end_date to modules table
+
+Revision ID: d2e731c7646d
+Revises: 8c45f108d04b
+Create Date: 2025-08-15 19:24:02.070379
+
+"""
+from alembic import op
+import sqlalchemy as sa
+revision = 'd2e731c7646d'
+down_revision = '8c45f108d04b'
+branch_labels = None
+depends_on = None
+def upgrade():
+    with op.batch_alter_table('modules', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('start_date', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('end_date', sa.DateTime(), nullable=True))
+    return
+def downgrade():
+    with op.batch_alter_table('modules', schema=None) as batch_op:
+        batch_op.drop_column('end_date')
+        batch_op.drop_column('start_date')
+    return
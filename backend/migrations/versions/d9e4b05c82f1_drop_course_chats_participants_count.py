@@ -0,0 +1,25 @@
+"""Drop course_chats.participants_count in favor of a computed property
+
+Revision ID: d9e4b05c82f1
+Revises: c3d8f1a27e90
+Create Date: 2026-09-01 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+revision = 'd9e4b05c82f1'
+down_revision = 'c3d8f1a27e90'
+branch_labels = None
+depends_on = None
+def upgrade():
+    try:
+        with op.batch_alter_table('course_chats') as batch_op:
+            batch_op.drop_column('participants_count')
+    except Exception:
+        pass
+def downgrade():
+    try:
+        with op.batch_alter_table('course_chats') as batch_op:
+            batch_op.add_column(sa.Column('participants_count', sa.Integer(), nullable=True))
+    except Exception:
+        pass
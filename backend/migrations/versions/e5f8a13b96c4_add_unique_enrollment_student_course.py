@@ -0,0 +1,25 @@
+"""Add unique constraint on enrollments (student_id, course_id)
+
+Revision ID: e5f8a13b96c4
+Revises: d9e4b05c82f1
+Create Date: 2026-09-01 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+revision = 'e5f8a13b96c4'
+down_revision = 'd9e4b05c82f1'
+branch_labels = None
+depends_on = None
+def upgrade():
+    try:
+        with op.batch_alter_table('enrollments') as batch_op:
+            batch_op.create_unique_constraint('uq_enrollment_student_course', ['student_id', 'course_id'])
+    except Exception:
+        pass
+def downgrade():
+    try:
+        with op.batch_alter_table('enrollments') as batch_op:
+            batch_op.drop_constraint('uq_enrollment_student_course', type_='unique')
+    except Exception:
+        pass
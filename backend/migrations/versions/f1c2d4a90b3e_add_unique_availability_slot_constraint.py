@@ -0,0 +1,25 @@
+"""Add unique constraint on natural availability slot key
+
+Revision ID: f1c2d4a90b3e
+Revises: ee7a42a8cf35
+Create Date: 2026-09-01 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+revision = 'f1c2d4a90b3e'
+down_revision = 'ee7a42a8cf35'
+branch_labels = None
+depends_on = None
+def upgrade():
+    try:
+        with op.batch_alter_table('availability') as batch_op:
+            batch_op.create_unique_constraint('uq_avail_slot', ['tutor_id', 'day_of_week', 'start_time', 'end_time', 'specific_date'])
+    except Exception:
+        pass
+def downgrade():
+    try:
+        with op.batch_alter_table('availability') as batch_op:
+            batch_op.drop_constraint('uq_avail_slot', type_='unique')
+    except Exception:
+        pass
@@ -0,0 +1,116 @@
+"""
+Tests for Bulk Timeslot Availability Endpoint
+Covers validation, authorization, and persistence for POST /api/tutors/<id>/availability/bulk
+"""
+import unittest
+import os
+import sys
+backend_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_path)
+from datetime import timedelta
+from flask_jwt_extended import create_access_token
+from app import create_app, db
+from app.models import User, Availability
+class TestBulkTimeslotsAPI(unittest.TestCase):
+    """API tests for the bulk timeslot creation endpoint"""
+    def setUp(self):
+        """Set up Flask app, test database, and users"""
+        self.app = create_app('testing')
+        self.app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(hours=1)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        self.client = self.app.test_client()
+        db.create_all()
+        self.admin_user = User(id='admin-timeslots-123', email='admin-timeslots@example.com', account_type='admin')
+        self.admin_user.set_password('admin123')
+        self.tutor_user = User(id='tutor-timeslots-123', email='tutor-timeslots@example.com', account_type='tutor', roles=['tutor'])
+        self.tutor_user.set_password('tutor123')
+        self.student_user = User(id='student-timeslots-123', email='student-timeslots@example.com', account_type='student', roles=['student'])
+        self.student_user.set_password('student123')
+        db.session.add_all([self.admin_user, self.tutor_user, self.student_user])
+        db.session.commit()
+        self.admin_token = create_access_token(identity='admin-timeslots-123')
+        self.tutor_token = create_access_token(identity='tutor-timeslots-123')
+        self.student_token = create_access_token(identity='student-timeslots-123')
+        self.url = '/api/tutors/tutor-timeslots-123/availability/bulk'
+    def tearDown(self):
+        """Clean up test database"""
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+    def _post(self, payload, token):
+        return self.client.post(self.url, json=payload, headers={'Authorization': f'Bearer {token}'})
+    def test_admin_adds_multiple_timeslots(self):
+        """Admin can create day-based and date-based slots in one request"""
+        payload = {'timeSlots': [{'day': 'monday', 'startTime': '09:00', 'endTime': '10:00'}, {'specificDate': '2024-01-16', 'startTime': '14:00', 'endTime': '15:30'}]}
+        response = self._post(payload, self.admin_token)
+        self.assertEqual(response.status_code, 201)
+        data = response.get_json()
+        self.assertEqual(data['createdCount'], 2)
+        self.assertEqual(data['tutorId'], 'tutor-timeslots-123')
+        records = (Availability.query.filter_by(tutor_id='tutor-timeslots-123')).all()
+        self.assertEqual(len(records), 2)
+        by_day = {record.day_of_week: record for record in records}
+        self.assertIn(0, by_day)
+        self.assertEqual(by_day[1].specific_date.isoformat(), '2024-01-16')
+    def test_tutor_adds_own_timeslots(self):
+        """A tutor can bulk-add slots to their own schedule"""
+        payload = {'timeSlots': [{'day': 'friday', 'startTime': '10:00', 'endTime': '12:00'}]}
+        response = self._post(payload, self.tutor_token)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Availability.query.count(), 1)
+    def test_missing_timeslots_list(self):
+        """Request without timeSlots returns 400"""
+        response = self._post({'timeSlots': []}, self.admin_token)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('timeSlots', (response.get_json())['error'])
+    def test_invalid_day_name_rejected(self):
+        """Unknown day name fails validation with the slot index reported"""
+        payload = {'timeSlots': [{'day': 'monday', 'startTime': '09:00', 'endTime': '10:00'}, {'day': 'funday', 'startTime': '09:00', 'endTime': '10:00'}]}
+        response = self._post(payload, self.admin_token)
+        self.assertEqual(response.status_code, 400)
+        data = response.get_json()
+        self.assertEqual(data['details'][0]['index'], 1)
+        self.assertEqual(Availability.query.count(), 0)
+    def test_invalid_time_format_rejected(self):
+        """Malformed start time fails validation"""
+        payload = {'timeSlots': [{'day': 'monday', 'startTime': '25:99', 'endTime': '10:00'}]}
+        response = self._post(payload, self.admin_token)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Invalid time range', (response.get_json())['details'][0]['error'])
+    def test_end_before_start_rejected(self):
+        """End time before start time fails validation"""
+        payload = {'timeSlots': [{'day': 'monday', 'startTime': '11:00', 'endTime': '10:00'}]}
+        response = self._post(payload, self.admin_token)
+        self.assertEqual(response.status_code, 400)
+    def test_invalid_specific_date_rejected(self):
+        """Malformed specificDate fails validation"""
+        payload = {'timeSlots': [{'specificDate': 'not-a-date', 'startTime': '09:00', 'endTime': '10:00'}]}
+        response = self._post(payload, self.admin_token)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('specificDate', (response.get_json())['details'][0]['error'])
+    def test_missing_required_field_rejected(self):
+        """Slot without endTime fails validation"""
+        payload = {'timeSlots': [{'day': 'monday', 'startTime': '09:00'}]}
+        response = self._post(payload, self.admin_token)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('endTime', (response.get_json())['details'][0]['error'])
+    def test_partial_failure_creates_nothing(self):
+        """One invalid slot rejects the whole batch"""
+        payload = {'timeSlots': [{'day': 'monday', 'startTime': '09:00', 'endTime': '10:00'}, {'day': 'tuesday', 'startTime': '09:00'}]}
+        response = self._post(payload, self.admin_token)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Availability.query.count(), 0)
+    def test_other_user_denied(self):
+        """A non-admin cannot add slots to another tutor's schedule"""
+        payload = {'timeSlots': [{'day': 'monday', 'startTime': '09:00', 'endTime': '10:00'}]}
+        response = self._post(payload, self.student_token)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(Availability.query.count(), 0)
+    def test_target_without_tutor_role(self):
+        """Targeting a user without the tutor role returns 404"""
+        response = self.client.post('/api/tutors/student-timeslots-123/availability/bulk', json={'timeSlots': [{'day': 'monday', 'startTime': '09:00', 'endTime': '10:00'}]}, headers={'Authorization': f'Bearer {self.admin_token}'})
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('tutor role', (response.get_json())['error'])
+if __name__ == '__main__':
+    unittest.main()
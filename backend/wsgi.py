@@ -0,0 +1,14 @@
+"""
+WSGI entry point for Gunicorn
+This avoids the import conflicts between app.py and the app package
+"""
+import os
+import sys
+sys.path.insert(0, '/app')
+from app import create_app
+application = create_app(os.getenv('FLASK_ENV', 'production'))
+app = application
+if __name__ == '__main__':
+    app.run(debug=False, host='0.0.0.0', port=5000)
+else:
+    pass